@@ -0,0 +1,55 @@
+"""
+NexusPM Enterprise - Slug Helpers
+
+Shared unique-slug resolution for models that auto-generate slugs
+(organizations, projects).
+"""
+
+import re
+
+from django.db import IntegrityError, transaction
+
+
+def unique_slug(queryset, base_slug, fallback='item'):
+    """
+    Return `base_slug`, or `base_slug-N` with the next free N when it is
+    already taken within `queryset`.
+    
+    Every taken "<slug>" / "<slug>-N" is fetched in one startswith query
+    instead of probing suffixes one at a time. `queryset` scopes the
+    uniqueness check and should exclude the instance being saved. An empty
+    `base_slug` (a name with no slug-safe characters) uses `fallback`.
+    """
+    base_slug = base_slug or fallback
+    taken = set(
+        queryset.filter(slug__startswith=base_slug).values_list('slug', flat=True)
+    )
+    if base_slug not in taken:
+        return base_slug
+    
+    suffix_pattern = re.compile(rf'^{re.escape(base_slug)}-(\d+)$')
+    suffixes = [
+        int(match.group(1))
+        for match in map(suffix_pattern.match, taken) if match
+    ]
+    return f"{base_slug}-{max(suffixes, default=0) + 1}"
+
+
+def save_with_unique_slug(instance, queryset, base_slug, save, *args,
+                          fallback='item', attempts=3, **kwargs):
+    """
+    Assign a unique slug to `instance` and `save(*args, **kwargs)` it.
+    
+    Two concurrent saves can resolve the same free slug; the loser hits the
+    unique constraint. Each attempt runs in a savepoint so an IntegrityError
+    leaves any outer transaction usable, and only a collision on the slug
+    itself (it is now taken in `queryset`) is retried with a fresh suffix.
+    """
+    for attempt in range(1, attempts + 1):
+        instance.slug = unique_slug(queryset, base_slug, fallback)
+        try:
+            with transaction.atomic():
+                return save(*args, **kwargs)
+        except IntegrityError:
+            if attempt == attempts or not queryset.filter(slug=instance.slug).exists():
+                raise
@@ -14,10 +14,11 @@ Enterprise Features:
 """
 
 from django.contrib import admin
-from django.utils.html import format_html
+from django.utils.html import format_html, escape
+from django.utils.safestring import mark_safe
 from django.utils import timezone
 from django.urls import reverse
-from django.db.models import Count, Q
+from django.db.models import Count, Q, Prefetch
 import logging
 
 from .models import (
@@ -29,6 +30,14 @@ from .models import (
 
 logger = logging.getLogger('nexuspm.organizations')
 
+# Constant logo markup for the changelist; values are escaped once per row
+LOGO_IMG_TEMPLATE = '<img src="{url}" width="30" height="30" style="border-radius: 4px;" />'
+LOGO_FALLBACK_TEMPLATE = (
+    '<div style="width:30px;height:30px;background:#007cba;color:white;border-radius:4px;'
+    'display:flex;align-items:center;justify-content:center;font-weight:bold;font-size:10px;">'
+    '{initials}</div>'
+)
+
 
 @admin.register(SubscriptionPlan)
 class SubscriptionPlanAdmin(admin.ModelAdmin):
@@ -99,6 +108,18 @@ class SubscriptionPlanAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate active subscription counts for the whole changelist page"""
+        return super().get_queryset(request).annotate(
+            _active_subs=Count(
+                'subscriptions',
+                filter=Q(subscriptions__status__in=[
+                    Subscription.Status.ACTIVE,
+                    Subscription.Status.TRIALING
+                ])
+            )
+        )
+    
     def price_monthly_display(self, obj):
         """Format monthly price for display"""
         if obj.price_monthly == 0:
@@ -123,11 +144,9 @@ class SubscriptionPlanAdmin(admin.ModelAdmin):
     
     def active_subscriptions_count(self, obj):
         """Count active subscriptions for this plan"""
-        count = obj.subscriptions.filter(
-            status__in=[Subscription.Status.ACTIVE, Subscription.Status.TRIALING]
-        ).count()
-        return count
+        return obj._active_subs
     active_subscriptions_count.short_description = "Active Subscriptions"
+    active_subscriptions_count.admin_order_field = '_active_subs'
 
 
 @admin.register(Organization)
@@ -168,6 +187,8 @@ class OrganizationAdmin(admin.ModelAdmin):
         'owner__last_name',
     ]
     
+    list_select_related = ('owner',)
+    
     readonly_fields = [
         'id',
         'created_at',
@@ -214,20 +235,25 @@ class OrganizationAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        """Optimize queries with select_related and prefetch_related"""
-        return super().get_queryset(request).select_related('owner')
+        """
+        Optimize queries with prefetch_related.
+        Current subscriptions are loaded for the whole page up front instead
+        of a query per row; member_count reads the maintained
+        active_members_count column.
+        """
+        current_subscriptions = Subscription.objects.filter(
+            status__in=[Subscription.Status.ACTIVE, Subscription.Status.TRIALING]
+        ).select_related('plan').order_by('-created_at')
+        # Prefetched into _active_subs, which Organization.current_subscription reads
+        return super().get_queryset(request).prefetch_related(
+            Prefetch('subscriptions', queryset=current_subscriptions, to_attr='_active_subs')
+        )
     
     def logo_preview(self, obj):
         """Show organization logo in admin list"""
         if obj.logo:
-            return format_html(
-                '<img src="{}" width="30" height="30" style="border-radius: 4px;" />',
-                obj.logo.url
-            )
-        return format_html(
-            '<div style="width:30px;height:30px;background:#007cba;color:white;border-radius:4px;display:flex;align-items:center;justify-content:center;font-weight:bold;font-size:10px;">{}</div>',
-            obj.name[:2].upper()
-        )
+            return mark_safe(LOGO_IMG_TEMPLATE.format(url=escape(obj.logo.url)))
+        return mark_safe(LOGO_FALLBACK_TEMPLATE.format(initials=escape(obj.name[:2].upper())))
     logo_preview.short_description = '🏢'
     
     def owner_email(self, obj):
@@ -270,9 +296,9 @@ class OrganizationAdmin(admin.ModelAdmin):
     
     def member_count(self, obj):
         """Show member count"""
-        count = obj.memberships.filter(is_active=True).count()
-        return f"{count} members"
+        return f"{obj.active_members_count} members"
     member_count.short_description = "Members"
+    member_count.admin_order_field = 'active_members_count'
 
 
 @admin.register(Subscription)
@@ -303,6 +329,8 @@ class SubscriptionAdmin(admin.ModelAdmin):
         'organization__slug',
     ]
     
+    list_select_related = ('organization', 'plan')
+    
     def organization_name(self, obj):
         return obj.organization.name
     organization_name.short_description = "Organization"
@@ -343,6 +371,8 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
         'organization__name',
     ]
     
+    list_select_related = ('user', 'organization')
+    
     def user_email(self, obj):
         return obj.user.email
     user_email.short_description = "User"
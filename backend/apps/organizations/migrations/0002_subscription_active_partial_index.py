@@ -0,0 +1,25 @@
+# Generated by Django 4.2.8 on 2026-10-15 22:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='organizatio_organiz_85249e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(condition=models.Q(('status__in', ['active', 'trialing'])), fields=['organization'], name='sub_org_active_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=models.Index(fields=['organization', '-created_at'], name='organizatio_organiz_3f8eb1_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.8 on 2026-10-15 22:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_members_count(apps, schema_editor):
+    """Populate the counter for existing organizations"""
+    Organization = apps.get_model('organizations', 'Organization')
+    OrganizationMembership = apps.get_model('organizations', 'OrganizationMembership')
+    active_members = OrganizationMembership.objects.filter(
+        organization=OuterRef('pk'),
+        is_active=True
+    ).values('organization').annotate(total=Count('pk')).values('total')
+    Organization.objects.update(
+        active_members_count=Coalesce(Subquery(active_members), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0002_subscription_active_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='active_members_count',
+            field=models.PositiveIntegerField(default=0, help_text='Cached number of active members, used for plan limit checks'),
+        ),
+        migrations.RunPython(backfill_active_members_count, migrations.RunPython.noop),
+    ]
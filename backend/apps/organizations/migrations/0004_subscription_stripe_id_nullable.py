@@ -0,0 +1,30 @@
+# Generated by Django 4.2.8 on 2026-10-15 22:53
+
+from django.db import migrations, models
+
+
+def blank_stripe_ids_to_null(apps, schema_editor):
+    """Unset Stripe ids are stored as NULL from now on"""
+    Subscription = apps.get_model('organizations', 'Subscription')
+    Subscription.objects.filter(stripe_subscription_id='').update(stripe_subscription_id=None)
+
+
+def null_stripe_ids_to_blank(apps, schema_editor):
+    Subscription = apps.get_model('organizations', 'Subscription')
+    Subscription.objects.filter(stripe_subscription_id__isnull=True).update(stripe_subscription_id='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0003_organization_active_members_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='subscription',
+            name='stripe_subscription_id',
+            field=models.CharField(blank=True, default=None, help_text='Stripe Subscription ID for payment processing', max_length=100, null=True, unique=True),
+        ),
+        migrations.RunPython(blank_stripe_ids_to_null, null_stripe_ids_to_blank),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.8 on 2026-10-15 22:56
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0004_subscription_stripe_id_nullable'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='organizatio_slug_048085_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='organizatio_owner_i_370edd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='organizatio_stripe__045cf6_idx',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.8 on 2026-10-15 22:57
+
+import apps.organizations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0005_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='phone',
+            field=models.CharField(blank=True, help_text='Primary contact phone number', max_length=20, validators=[apps.organizations.models.validate_phone_number]),
+        ),
+    ]
@@ -18,16 +18,46 @@ Business Model:
 - Usage tracking for billing and limits enforcement
 """
 
+import re
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
-from django.core.validators import RegexValidator
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from decimal import Decimal
 
+from apps.core.slugs import save_with_unique_slug
+
 User = get_user_model()
 
+# Compiled once at import and shared by every phone validation
+PHONE_NUMBER_PATTERN = re.compile(r'^\+?1?\d{9,15}$')
+
+
+def validate_phone_number(value):
+    """Validate a phone number in '+999999999' format (9-15 digits)"""
+    if not PHONE_NUMBER_PATTERN.match(value):
+        raise ValidationError(
+            "Phone number must be in format: '+999999999'",
+            code='invalid'
+        )
+
+
+class SubscriptionPlanManager(models.Manager):
+    """Custom manager for SubscriptionPlan model with common queries"""
+    
+    def pricing_only(self):
+        """
+        Plans without the `features` JSON, for pricing pages and billing.
+        Don't use it where has_feature() will be called.
+        """
+        return self.get_queryset().only(
+            'id', 'name', 'plan_type', 'price_monthly', 'price_yearly', 'is_active'
+        )
+
 
 class SubscriptionPlan(models.Model):
     """
@@ -124,6 +154,8 @@ class SubscriptionPlan(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SubscriptionPlanManager()
+    
     class Meta:
         db_table = 'organizations_subscription_plan'
         verbose_name = 'Subscription Plan'
@@ -133,9 +165,14 @@ class SubscriptionPlan(models.Model):
     def __str__(self):
         return f"{self.name} (${self.price_monthly}/month)"
     
-    @property
+    def save(self, *args, **kwargs):
+        """Drop the cached yearly discount in case prices changed"""
+        self.__dict__.pop('yearly_discount_percentage', None)
+        super().save(*args, **kwargs)
+    
+    @cached_property
     def yearly_discount_percentage(self):
-        """Calculate the discount percentage for yearly billing"""
+        """Calculate the discount percentage for yearly billing (cached per instance)"""
         if self.price_monthly == 0:
             return 0
         monthly_yearly = self.price_monthly * 12
@@ -177,6 +214,14 @@ class OrganizationMembership(models.Model):
         MEMBER = 'member', 'Member'        # Standard access
         VIEWER = 'viewer', 'Viewer'        # Read-only access
     
+    # Role → permissions table, built once at import for O(1) lookups
+    ROLE_PERMISSIONS = {
+        Role.OWNER: frozenset({'all'}),
+        Role.ADMIN: frozenset({'manage_users', 'manage_projects', 'view_analytics'}),
+        Role.MEMBER: frozenset({'create_projects', 'manage_tasks'}),
+        Role.VIEWER: frozenset({'view_projects', 'view_tasks'}),
+    }
+    
     # Relationships
     user = models.ForeignKey(
         User,
@@ -248,17 +293,113 @@ class OrganizationMembership(models.Model):
         Check if this membership has a specific permission.
         This will be expanded as we build the permission system.
         """
-        role_permissions = {
-            self.Role.OWNER: ['all'],
-            self.Role.ADMIN: ['manage_users', 'manage_projects', 'view_analytics'],
-            self.Role.MEMBER: ['create_projects', 'manage_tasks'],
-            self.Role.VIEWER: ['view_projects', 'view_tasks'],
-        }
-        
-        user_permissions = role_permissions.get(self.role, [])
+        user_permissions = self.ROLE_PERMISSIONS.get(self.role, frozenset())
         return 'all' in user_permissions or permission in user_permissions
 
 
+class OrganizationManager(models.Manager):
+    """Custom manager for Organization model with common queries"""
+    
+    def lite(self):
+        """
+        Organizations without the `settings` JSON and other wide columns,
+        for routing and permission lookups that only need identity/status.
+        """
+        return self.get_queryset().only('id', 'slug', 'name', 'status', 'owner_id')
+    
+    def create(self, **kwargs):
+        """
+        Create an organization and run its post_save bootstrap (subscription,
+        owner membership) in one transaction, so a failed signup leaves no
+        half set up organization behind.
+        """
+        with transaction.atomic():
+            return super().create(**kwargs)
+    
+    def bulk_provision(self, organizations, batch_size=500):
+        """
+        Create many organizations at once (tenant imports, enterprise onboarding).
+        
+        bulk_create sends no signals, so the setup organization_created_handler
+        does per row is done here in bulk: default settings, one Free trial
+        subscription and one owner membership per organization. For N
+        organizations this is a handful of queries instead of ~5N.
+        Blank slugs are slugified from the name and must not collide; it all
+        runs in one transaction, so a collision provisions nothing.
+        """
+        now = timezone.now()
+        organizations = list(organizations)
+        
+        # Default settings read the owner: load owners given only by id at once
+        owner_field = self.model._meta.get_field('owner')
+        owners = User.objects.in_bulk({
+            organization.owner_id for organization in organizations
+            if not owner_field.is_cached(organization)
+        })
+        for organization in organizations:
+            if not owner_field.is_cached(organization):
+                organization.owner = owners[organization.owner_id]
+            organization.slug = organization.slug or slugify(organization.name)
+            organization.settings = organization.settings or organization.get_default_settings()
+            organization.active_members_count = 1  # The owner
+        
+        with transaction.atomic():
+            organizations = self.bulk_create(organizations, batch_size=batch_size)
+            
+            free_plan = SubscriptionPlan.objects.filter(
+                plan_type=SubscriptionPlan.PlanType.FREE
+            ).first()
+            if free_plan:
+                trial_end = now + timezone.timedelta(days=14)  # 14-day trial
+                Subscription.objects.bulk_create([
+                    Subscription(
+                        organization=organization,
+                        plan=free_plan,
+                        status=Subscription.Status.TRIALING,
+                        billing_cycle=Subscription.BillingCycle.MONTHLY,
+                        current_period_start=now,
+                        current_period_end=trial_end,
+                        trial_start=now,
+                        trial_end=trial_end
+                    )
+                    for organization in organizations
+                ], batch_size=batch_size)
+            
+            OrganizationMembership.objects.bulk_create([
+                OrganizationMembership(
+                    user_id=organization.owner_id,
+                    organization=organization,
+                    role=OrganizationMembership.Role.OWNER,
+                    is_active=True
+                )
+                for organization in organizations
+            ], batch_size=batch_size)
+        
+        # Membership signals didn't run, so drop the owners' cached org ids
+        cache.delete_many([
+            User.organization_ids_cache_key(organization.owner_id)
+            for organization in organizations
+        ])
+        
+        return organizations
+    
+    def with_current_plan(self):
+        """
+        Prefetch each organization's active/trialing subscription and plan.
+        current_subscription/current_plan then read the prefetched rows, so
+        listing N organizations costs 2 queries instead of 2N.
+        """
+        return self.get_queryset().prefetch_related(
+            models.Prefetch(
+                'subscriptions',
+                queryset=Subscription.objects.filter(
+                    status__in=[Subscription.Status.ACTIVE, Subscription.Status.TRIALING]
+                ).select_related('plan').order_by('-created_at'),
+                to_attr='_active_subs'
+            )
+        )
+
+
 class Organization(models.Model):
     """
     The root entity for multi-tenancy in NexusPM Enterprise.
@@ -345,10 +486,7 @@ class Organization(models.Model):
     phone = models.CharField(
         max_length=20,
         blank=True,
-        validators=[RegexValidator(
-            regex=r'^\+?1?\d{9,15}$',
-            message="Phone number must be in format: '+999999999'"
-        )],
+        validators=[validate_phone_number],
         help_text="Primary contact phone number"
     )
     
@@ -373,6 +511,12 @@ class Organization(models.Model):
         help_text="Stripe Customer ID for billing"
     )
     
+    # Denormalized counters (kept in sync by membership signals)
+    active_members_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Cached number of active members, used for plan limit checks"
+    )
+    
     # Member relationships - FIXED: specify which ForeignKeys to use
     members = models.ManyToManyField(
         User,
@@ -387,13 +531,14 @@ class Organization(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
     
+    objects = OrganizationManager()
+    
     class Meta:
         db_table = 'organizations_organization'
         verbose_name = 'Organization'
         verbose_name_plural = 'Organizations'
         indexes = [
-            models.Index(fields=['slug']),
-            models.Index(fields=['owner']),
+            # slug (unique) and owner (FK) are already indexed by their fields
             models.Index(fields=['status', 'created_at']),
         ]
     
@@ -402,32 +547,42 @@ class Organization(models.Model):
     
     def save(self, *args, **kwargs):
         """Auto-generate slug from name if not provided"""
-        if not self.slug:
-            self.slug = slugify(self.name)
-            
-            # Ensure slug uniqueness
-            counter = 1
-            original_slug = self.slug
-            while Organization.objects.filter(slug=self.slug).exclude(id=self.id).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+        if self.slug:
+            return super().save(*args, **kwargs)
         
-        super().save(*args, **kwargs)
+        # Slugs are globally unique (subdomains)
+        return save_with_unique_slug(
+            self, Organization.objects.exclude(id=self.id), slugify(self.name),
+            super().save, *args, fallback='org', **kwargs
+        )
     
     # Business logic methods
-    @property
+    @cached_property
     def current_subscription(self):
-        """Get the current active subscription"""
+        """
+        Get the current active subscription.
+        Cached on the instance so repeated feature/limit checks share one query,
+        and read from with_current_plan() prefetches when available.
+        """
+        if '_active_subs' in self.__dict__:
+            return self._active_subs[0] if self._active_subs else None
+        # Newest live subscription wins; served by the (organization, -created_at) index
         return self.subscriptions.filter(
             status__in=[Subscription.Status.ACTIVE, Subscription.Status.TRIALING]
-        ).first()
+        ).select_related('plan').order_by('-created_at').first()
     
-    @property
+    @cached_property
     def current_plan(self):
         """Get the current subscription plan"""
         subscription = self.current_subscription
         return subscription.plan if subscription else None
     
+    def invalidate_subscription_cache(self):
+        """Forget the cached current subscription/plan after a subscription change"""
+        self.__dict__.pop('current_subscription', None)
+        self.__dict__.pop('current_plan', None)
+        cache.delete(self.usage_limits_cache_key(self.pk))
+    
     def is_feature_enabled(self, feature_name):
         """Check if a feature is enabled for this organization"""
         plan = self.current_plan
@@ -452,20 +607,64 @@ class Organization(models.Model):
             'max_projects_per_workspace': plan.max_projects_per_workspace
         }
     
+    # Cached usage limits
+    USAGE_LIMITS_CACHE_TTL = 300  # seconds
+    
+    @staticmethod
+    def usage_limits_cache_key(organization_id):
+        """Cache key for an organization's plan usage limits"""
+        return f"org:limits:{organization_id}"
+    
+    def get_cached_usage_limits(self):
+        """
+        get_usage_limits() through the shared cache, for hot paths that
+        check limits on every create. Subscription and plan changes
+        invalidate the entry.
+        """
+        return cache.get_or_set(
+            self.usage_limits_cache_key(self.pk),
+            self.get_usage_limits,
+            self.USAGE_LIMITS_CACHE_TTL
+        )
+    
     def check_usage_limit(self, limit_type):
         """Check if organization is within usage limits"""
         limits = self.get_usage_limits()
         
         if limit_type == 'workspaces':
-            current = self.workspaces.filter(deleted_at__isnull=True).count()
-            return current < limits['max_workspaces']
+            workspaces = self.workspaces.filter(deleted_at__isnull=True)
+            return self._is_below_limit(workspaces, limits['max_workspaces'])
         elif limit_type == 'users':
-            current = self.memberships.filter(is_active=True).count()
-            return current < limits['max_users']
+            return self.active_members_count < limits['max_users']
         # Add more limit checks as needed
         
         return True
     
+    @staticmethod
+    def _is_below_limit(queryset, limit):
+        """
+        Check whether a queryset has fewer than `limit` rows.
+        Reads at most `limit` primary keys instead of COUNT(*)-ing every row.
+        """
+        return len(queryset.values_list('pk', flat=True)[:limit]) < limit
+    
+    def get_default_settings(self):
+        """Default organization settings, seeded from the owner's preferences"""
+        return {
+            'created_via': 'web',  # Could be 'api', 'invitation', etc.
+            'onboarding_completed': False,
+            'notifications': {
+                'email_project_updates': True,
+                'email_task_assignments': True,
+                'email_mentions': True,
+            },
+            'preferences': {
+                'default_timezone': self.owner.timezone,
+                'default_language': self.owner.language,
+                'week_starts_on': 'monday',
+            }
+        }
+    
     def soft_delete(self):
         """Soft delete the organization and all related data"""
         self.deleted_at = timezone.now()
@@ -473,6 +672,63 @@ class Organization(models.Model):
         self.save(update_fields=['deleted_at', 'status'])
 
 
+class SubscriptionManager(models.Manager):
+    """Custom manager for Subscription model with common queries"""
+    
+    def bulk_sync_from_stripe(self, events, batch_size=500):
+        """
+        Apply Stripe subscription updates (e.g. a reconciliation run) in bulk.
+        
+        `events` is an iterable of
+        (stripe_subscription_id, status, current_period_start, current_period_end)
+        tuples; later events for the same subscription win and unknown ids are
+        skipped. Rows are written with bulk_update, so no per-row post_save
+        fires; organizations with a now-active subscription are reactivated
+        in one UPDATE instead. Returns the updated subscriptions.
+        """
+        events = list(events)
+        subscriptions = self.in_bulk(
+            {stripe_id for stripe_id, *_ in events},
+            field_name='stripe_subscription_id'
+        )
+        
+        now = timezone.now()
+        changed = {}
+        for stripe_id, status, period_start, period_end in events:
+            subscription = subscriptions.get(stripe_id)
+            if subscription is None:
+                continue
+            subscription.status = status
+            subscription.current_period_start = period_start
+            subscription.current_period_end = period_end
+            subscription.updated_at = now
+            changed[subscription.pk] = subscription
+        
+        changed = list(changed.values())
+        self.bulk_update(
+            changed,
+            ['status', 'current_period_start', 'current_period_end', 'updated_at'],
+            batch_size=batch_size
+        )
+        
+        # No post_save ran, so drop the cached limits of every touched organization
+        cache.delete_many([
+            Organization.usage_limits_cache_key(subscription.organization_id)
+            for subscription in changed
+        ])
+        
+        activated_organization_ids = {
+            subscription.organization_id for subscription in changed
+            if subscription.status == Subscription.Status.ACTIVE
+        }
+        if activated_organization_ids:
+            Organization.objects.filter(pk__in=activated_organization_ids).exclude(
+                status=Organization.Status.ACTIVE
+            ).update(status=Organization.Status.ACTIVE, updated_at=now)
+        
+        return changed
+
+
 class Subscription(models.Model):
     """
     Represents the billing relationship between an Organization and a Plan.
@@ -532,7 +788,9 @@ class Subscription(models.Model):
     stripe_subscription_id = models.CharField(
         max_length=100,
         unique=True,
+        null=True,  # NULL (not '') when unset, so local/trial subscriptions don't collide
         blank=True,
+        default=None,
         help_text="Stripe Subscription ID for payment processing"
     )
     
@@ -571,13 +829,21 @@ class Subscription(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SubscriptionManager()
+    
     class Meta:
         db_table = 'organizations_subscription'
         verbose_name = 'Subscription'
         verbose_name_plural = 'Subscriptions'
         indexes = [
-            models.Index(fields=['organization', 'status']),
-            models.Index(fields=['stripe_subscription_id']),
+            # Current subscription lookups only ever touch live rows, so keep
+            # that index partial and tiny; history is served by created_at
+            models.Index(
+                fields=['organization'],
+                condition=models.Q(status__in=['active', 'trialing']),
+                name='sub_org_active_partial'
+            ),
+            models.Index(fields=['organization', '-created_at']),
             models.Index(fields=['current_period_end']),
         ]
     
@@ -608,8 +874,10 @@ class Subscription(models.Model):
         """Cancel the subscription"""
         if at_period_end:
             self.cancel_at_period_end = True
+            update_fields = ['cancel_at_period_end', 'updated_at']
         else:
             self.status = self.Status.CANCELLED
             self.cancelled_at = timezone.now()
-        
-        self.save()
\ No newline at end of file
+            update_fields = ['status', 'cancelled_at', 'updated_at']
+
+        self.save(update_fields=update_fields)
\ No newline at end of file
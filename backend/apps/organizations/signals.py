@@ -13,10 +13,15 @@ Key Responsibilities:
 - Audit logging for compliance and debugging
 """
 
-from django.db.models.signals import post_save, pre_delete, post_delete
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
+from functools import lru_cache, partial
 import logging
 
 from .models import Organization, Subscription, SubscriptionPlan, OrganizationMembership
@@ -25,6 +30,49 @@ User = get_user_model()
 logger = logging.getLogger('nexuspm.organizations')
 
 
+def _audit_log(level, message, extra=None):
+    """
+    Emit an audit log record once the surrounding transaction commits.
+    Keeps slow log sinks out of the commit path, and changes that get
+    rolled back are never logged.
+    """
+    transaction.on_commit(partial(logger.log, level, message, extra=extra))
+
+
+@lru_cache(maxsize=8)
+def _get_plan_by_type(plan_type):
+    """
+    Get the subscription plan for a plan type, memoized per process.
+    Plans almost never change; plan_changed_handler clears the cache.
+    """
+    return SubscriptionPlan.objects.get(plan_type=plan_type)
+
+
+@receiver(post_save, sender=SubscriptionPlan)
+@receiver(post_delete, sender=SubscriptionPlan)
+def plan_changed_handler(sender, instance, **kwargs):
+    """Drop memoized plans and subscribers' cached limits when a plan changes"""
+    _get_plan_by_type.cache_clear()
+    cache.delete_many([
+        Organization.usage_limits_cache_key(organization_id)
+        for organization_id in Subscription.objects.filter(
+            plan_id=instance.pk
+        ).values_list('organization_id', flat=True).distinct()
+    ])
+
+
+@receiver(pre_save, sender=Organization)
+def organization_default_settings_handler(sender, instance, **kwargs):
+    """
+    Set up default organization settings before the first INSERT.
+    
+    Filling them in pre_save means the new row is written once, instead of
+    being inserted and then updated again from organization_created_handler.
+    """
+    if instance._state.adding and not instance.settings:
+        instance.settings = instance.get_default_settings()
+
+
 @receiver(post_save, sender=Organization)
 def organization_created_handler(sender, instance, created, **kwargs):
     """
@@ -33,13 +81,20 @@ def organization_created_handler(sender, instance, created, **kwargs):
     This is critical for SaaS setup - every new organization needs:
     1. A default subscription (usually Free plan)
     2. The owner as the first member with Owner role
-    3. Default organization settings
-    4. Audit logging for tracking
+    3. Audit logging for tracking
+    
+    Default settings are applied in organization_default_settings_handler.
+    Organization.objects.create() runs the INSERT and this bootstrap in one
+    transaction; updates (created=False) open none.
     """
-    if created:
-        logger.info(
+    if not created:
+        return
+    
+    with transaction.atomic():
+        _audit_log(
+            logging.INFO,
             f"New organization created: {instance.name} (ID: {instance.id})",
-            extra={
+            {
                 'organization_id': str(instance.id),
                 'organization_name': instance.name,
                 'owner_email': instance.owner.email,
@@ -49,7 +104,7 @@ def organization_created_handler(sender, instance, created, **kwargs):
         
         # 1. Create default Free subscription
         try:
-            free_plan = SubscriptionPlan.objects.get(plan_type=SubscriptionPlan.PlanType.FREE)
+            free_plan = _get_plan_by_type(SubscriptionPlan.PlanType.FREE)
             
             # Create subscription with trial period (common SaaS pattern)
             trial_end = timezone.now() + timezone.timedelta(days=14)  # 14-day trial
@@ -65,44 +120,21 @@ def organization_created_handler(sender, instance, created, **kwargs):
                 trial_end=trial_end
             )
             
-            logger.info(f"Created Free trial subscription for organization {instance.name}")
+            _audit_log(logging.INFO, f"Created Free trial subscription for organization {instance.name}")
             
         except SubscriptionPlan.DoesNotExist:
-            logger.error(f"Free plan not found! Cannot create subscription for {instance.name}")
+            _audit_log(logging.ERROR, f"Free plan not found! Cannot create subscription for {instance.name}")
         
         # 2. Make the owner the first member with Owner role
-        OrganizationMembership.objects.get_or_create(
+        # (a brand-new organization cannot have memberships yet)
+        OrganizationMembership.objects.create(
             user=instance.owner,
             organization=instance,
-            defaults={
-                'role': OrganizationMembership.Role.OWNER,
-                'is_active': True,
-                'joined_at': timezone.now()
-            }
+            role=OrganizationMembership.Role.OWNER,
+            is_active=True
         )
         
-        logger.info(f"Added owner {instance.owner.email} as Owner of {instance.name}")
-        
-        # 3. Set up default organization settings
-        default_settings = {
-            'created_via': 'web',  # Could be 'api', 'invitation', etc.
-            'onboarding_completed': False,
-            'notifications': {
-                'email_project_updates': True,
-                'email_task_assignments': True,
-                'email_mentions': True,
-            },
-            'preferences': {
-                'default_timezone': instance.owner.timezone,
-                'default_language': instance.owner.language,
-                'week_starts_on': 'monday',
-            }
-        }
-        
-        # Update settings if empty
-        if not instance.settings:
-            instance.settings = default_settings
-            instance.save(update_fields=['settings'])
+        _audit_log(logging.INFO, f"Added owner {instance.owner.email} as Owner of {instance.name}")
         
         # TODO: Send welcome email to organization owner
         # TODO: Track organization creation in analytics
@@ -119,10 +151,25 @@ def subscription_changed_handler(sender, instance, created, **kwargs):
     - Handle upgrades/downgrades
     - Enforce usage limits based on plan changes
     """
+    # Subscriptions saved from a bare pk lookup (e.g. webhooks) have neither
+    # relation loaded; fetch both in one JOIN instead of two lazy SELECTs
+    missing = [
+        name for name in ('organization', 'plan')
+        if not Subscription._meta.get_field(name).is_cached(instance)
+    ]
+    if missing:
+        related = Subscription.objects.select_related(*missing).get(pk=instance.pk)
+        for name in missing:
+            setattr(instance, name, getattr(related, name))
+    
+    # The organization's cached current subscription/plan may now be stale
+    instance.organization.invalidate_subscription_cache()
+    
     if created:
-        logger.info(
+        _audit_log(
+            logging.INFO,
             f"New subscription created: {instance.organization.name} → {instance.plan.name}",
-            extra={
+            {
                 'organization_id': str(instance.organization.id),
                 'plan_type': instance.plan.plan_type,
                 'billing_cycle': instance.billing_cycle,
@@ -130,9 +177,10 @@ def subscription_changed_handler(sender, instance, created, **kwargs):
             }
         )
     else:
-        logger.info(
+        _audit_log(
+            logging.INFO,
             f"Subscription updated: {instance.organization.name} → {instance.plan.name} ({instance.status})",
-            extra={
+            {
                 'organization_id': str(instance.organization.id),
                 'plan_type': instance.plan.plan_type,
                 'status': instance.status,
@@ -143,19 +191,86 @@ def subscription_changed_handler(sender, instance, created, **kwargs):
     # Handle status changes
     if instance.status == Subscription.Status.CANCELLED:
         # Organization subscription cancelled - handle gracefully
-        logger.warning(f"Organization {instance.organization.name} subscription cancelled")
+        _audit_log(logging.WARNING, f"Organization {instance.organization.name} subscription cancelled")
         
     elif instance.status == Subscription.Status.ACTIVE:
-        # Subscription activated - ensure full access
-        if instance.organization.status != Organization.Status.ACTIVE:
-            instance.organization.status = Organization.Status.ACTIVE
-            instance.organization.save(update_fields=['status'])
+        # Subscription activated - ensure full access. Webhook retries
+        # redeliver the same event, so only write when the status differs,
+        # and do it with a guarded UPDATE (no Organization signals needed)
+        organization = instance.organization
+        if organization.status != Organization.Status.ACTIVE:
+            Organization.objects.filter(pk=organization.pk).exclude(
+                status=Organization.Status.ACTIVE
+            ).update(status=Organization.Status.ACTIVE, updated_at=timezone.now())
+            organization.status = Organization.Status.ACTIVE
         
-        logger.info(f"Organization {instance.organization.name} subscription activated")
+        _audit_log(logging.INFO, f"Organization {instance.organization.name} subscription activated")
     
     elif instance.status == Subscription.Status.PAST_DUE:
         # Payment failed - handle gracefully (don't immediately cut access)
-        logger.warning(f"Organization {instance.organization.name} payment past due")
+        _audit_log(logging.WARNING, f"Organization {instance.organization.name} payment past due")
+
+
+@receiver(post_delete, sender=Subscription)
+def subscription_deleted_handler(sender, instance, **kwargs):
+    """Drop the organization's cached usage limits when a subscription is deleted"""
+    cache.delete(Organization.usage_limits_cache_key(instance.organization_id))
+
+
+def _apply_member_count_delta(membership, delta):
+    """
+    Adjust active_members_count by `delta` with one F() UPDATE (never below
+    0) and mirror it on the membership's loaded organization.
+    """
+    Organization.objects.filter(pk=membership.organization_id).update(
+        active_members_count=Greatest(F('active_members_count') + delta, 0)
+    )
+    if OrganizationMembership._meta.get_field('organization').is_cached(membership):
+        organization = membership.organization
+        organization.active_members_count = max(organization.active_members_count + delta, 0)
+
+
+@receiver(pre_save, sender=OrganizationMembership)
+def membership_active_state_handler(sender, instance, update_fields=None, **kwargs):
+    """Remember whether a membership about to be updated is stored as active"""
+    if kwargs.get('raw') or instance._state.adding:
+        return
+    if update_fields is not None and 'is_active' not in update_fields:
+        return
+    
+    instance._was_active = OrganizationMembership.objects.filter(
+        pk=instance.pk
+    ).values_list('is_active', flat=True).first()
+
+
+@receiver(post_save, sender=OrganizationMembership)
+def membership_counter_handler(sender, instance, created, **kwargs):
+    """
+    Keep Organization.active_members_count in sync with memberships.
+    
+    Only new active members and saves that actually flip is_active touch
+    the organization, as an atomic F() increment or decrement.
+    Fixture loads (raw saves) already carry the count and are skipped.
+    """
+    if kwargs.get('raw'):
+        return
+    
+    if created:
+        if instance.is_active:
+            _apply_member_count_delta(instance, 1)
+        return
+    
+    was_active = instance.__dict__.pop('_was_active', None)
+    if was_active is None or was_active == instance.is_active:
+        return
+    _apply_member_count_delta(instance, 1 if instance.is_active else -1)
+
+
+@receiver(post_delete, sender=OrganizationMembership)
+def membership_removed_counter_handler(sender, instance, **kwargs):
+    """Decrement the organization's active member counter"""
+    if instance.is_active:
+        _apply_member_count_delta(instance, -1)
 
 
 @receiver(post_save, sender=OrganizationMembership)
@@ -169,9 +284,10 @@ def membership_created_handler(sender, instance, created, **kwargs):
     - Handle user limits enforcement
     """
     if created:
-        logger.info(
+        _audit_log(
+            logging.INFO,
             f"New member added: {instance.user.email} → {instance.organization.name} ({instance.role})",
-            extra={
+            {
                 'user_id': str(instance.user.id),
                 'organization_id': str(instance.organization.id),
                 'role': instance.role,
@@ -182,14 +298,26 @@ def membership_created_handler(sender, instance, created, **kwargs):
         # Check user limits for the organization's plan
         current_plan = instance.organization.current_plan
         if current_plan:
-            active_members = instance.organization.memberships.filter(is_active=True).count()
+            # Already includes this member: membership_counter_handler runs first
+            active_members = instance.organization.active_members_count
             if active_members > current_plan.max_users:
-                logger.warning(
+                _audit_log(
+                    logging.WARNING,
                     f"Organization {instance.organization.name} exceeded user limit: "
                     f"{active_members}/{current_plan.max_users}"
                 )
 
 
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_delete, sender=OrganizationMembership)
+def membership_access_cache_handler(sender, instance, **kwargs):
+    """
+    Drop the member's cached organization ids whenever a membership is
+    added, changed (e.g. deactivated) or removed.
+    """
+    cache.delete(User.organization_ids_cache_key(instance.user_id))
+
+
 @receiver(pre_delete, sender=Organization)
 def organization_deleting_handler(sender, instance, **kwargs):
     """
@@ -200,9 +328,10 @@ def organization_deleting_handler(sender, instance, **kwargs):
     - Cancel active subscriptions
     - Log deletion for audit trail
     """
-    logger.warning(
+    _audit_log(
+        logging.WARNING,
         f"Organization being deleted: {instance.name} (ID: {instance.id})",
-        extra={
+        {
             'organization_id': str(instance.id),
             'organization_name': instance.name,
             'owner_email': instance.owner.email,
@@ -210,14 +339,24 @@ def organization_deleting_handler(sender, instance, **kwargs):
         }
     )
     
-    # Cancel active subscriptions
+    # Cancel active subscriptions in a single UPDATE (no per-row save/signals)
     active_subscriptions = instance.subscriptions.filter(
         status__in=[Subscription.Status.ACTIVE, Subscription.Status.TRIALING]
     )
+    subscription_ids = list(active_subscriptions.values_list('id', flat=True))
     
-    for subscription in active_subscriptions:
-        subscription.status = Subscription.Status.CANCELLED
-        subscription.cancelled_at = timezone.now()
-        subscription.save()
+    if subscription_ids:
+        now = timezone.now()
+        Subscription.objects.filter(id__in=subscription_ids).update(
+            status=Subscription.Status.CANCELLED,
+            cancelled_at=now,
+            updated_at=now
+        )
+        # update() sends no signals: drop the cached plan and usage limits here
+        instance.invalidate_subscription_cache()
         
-        logger.info(f"Cancelled subscription {subscription.id} for deleting organization")
\ No newline at end of file
+        _audit_log(
+            logging.INFO,
+            f"Cancelled {len(subscription_ids)} subscription(s) for deleting organization: "
+            f"{', '.join(str(subscription_id) for subscription_id in subscription_ids)}"
+        )
\ No newline at end of file
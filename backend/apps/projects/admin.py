@@ -1,66 +1,95 @@
 """
 NexusPM Enterprise - Projects & Tasks Admin Configuration (FIXED)
 
-Fixed the form field access issues for JSON fields.
+JSON field defaults and help text are declared on the model fields.
 """
 
 from django.contrib import admin
-from django.utils.html import format_html
-from django.urls import reverse
-from django.db.models import Count, Q, Avg
-from django.utils import timezone
-from django import forms
-import logging
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
+from django.urls import get_script_prefix, reverse
+from django.db.models import (
+    Count, F, Case, When, ExpressionWrapper, BooleanField, DurationField,
+    OuterRef, Subquery
+)
+from django.db.models.functions import Coalesce, Now, TruncDate
+from functools import lru_cache
 
 from .models import Project, Task, ProjectMembership, TaskDependency
 
-logger = logging.getLogger('nexuspm.projects')
+# Changelist icon lookups, built once instead of per rendered row
+PROJECT_PRIORITY_COLORS = {
+    'low': '#6B7280',
+    'medium': '#3B82F6',
+    'high': '#F59E0B',
+    'urgent': '#EF4444',
+    'critical': '#DC2626',
+}
+PROJECT_STATUS_ICONS = {
+    'planning': '📋',
+    'active': '🚀',
+    'on_hold': '⏸️',
+    'completed': '✅',
+    'cancelled': '❌',
+    'archived': '📦',
+}
+TASK_STATUS_COLORS = {
+    'todo': '#6B7280',
+    'in_progress': '#3B82F6',
+    'in_review': '#F59E0B',
+    'blocked': '#EF4444',
+    'completed': '#10B981',
+    'verified': '#059669',
+}
+TASK_PRIORITY_INDICATORS = {
+    'low': '●',
+    'medium': '●●',
+    'high': '●●●',
+    'urgent': '🔥',
+}
 
+# Per-row HTML. Colors, icons, URLs and percentages come from the tables
+# above and from integer/UUID values, so only user text needs escaping
+# (see _change_link); this skips format_html's per-argument escaping.
+CHANGE_LINK_TEMPLATE = '<a href="{url}">{text}</a>'
+PROJECT_ICON_TEMPLATE = (
+    '<div style="display:flex;align-items:center;">'
+    '<div style="width:20px;height:20px;background:{color};border-radius:3px;display:flex;align-items:center;justify-content:center;margin-right:8px;font-size:12px;">{icon}</div>'
+    '</div>'
+)
+PROGRESS_BAR_TEMPLATE = (
+    '<div style="width:100px;background:#E5E7EB;border-radius:10px;height:16px;">'
+    '<div style="width:{pct}%;background:{color};border-radius:10px;height:16px;display:flex;align-items:center;justify-content:center;color:white;font-size:10px;font-weight:bold;">{pct}%</div>'
+    '</div>'
+)
+TASK_ICON_TEMPLATE = '<span style="color: {color}; font-size: 14px;">{indicator}</span>'
+HOURS_TEMPLATE = '<span style="color: {color};">{actual:.1f}h / {estimated:.1f}h{suffix}</span>'
 
-class ProjectAdminForm(forms.ModelForm):
-    """Custom form for Project admin with better JSON field handling"""
-    class Meta:
-        model = Project
-        fields = '__all__'
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Set default values and help text for JSON fields
-        if not self.instance.pk:  # Only for new projects
-            if 'tags' in self.fields:
-                self.fields['tags'].initial = []
-            if 'settings' in self.fields:
-                self.fields['settings'].initial = {}
-        
-        # Add help text safely
-        if 'tags' in self.fields:
-            self.fields['tags'].help_text = "Project tags (e.g., ['web', 'mobile', 'urgent']). Leave as [] for no tags."
-            self.fields['tags'].required = False
-        
-        if 'settings' in self.fields:
-            self.fields['settings'].help_text = "Project settings JSON. Leave as {} for defaults."
-            self.fields['settings'].required = False
 
+@lru_cache(maxsize=None)
+def _change_url_template(viewname, script_prefix):
+    """
+    Resolve an admin change URL once per script prefix, leaving a '{}' slot
+    for the pk. reverse() bakes in the current request's prefix, so it is
+    part of the cache key.
+    """
+    return reverse(viewname, args=['__pk__']).replace('__pk__', '{}')
 
-class TaskAdminForm(forms.ModelForm):
-    """Custom form for Task admin with better JSON field handling"""
-    class Meta:
-        model = Task
-        fields = '__all__'
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Set default values for JSON fields safely
-        if not self.instance.pk:  # Only for new tasks
-            if 'tags' in self.fields:
-                self.fields['tags'].initial = []
-        
-        # Add help text safely
-        if 'tags' in self.fields:
-            self.fields['tags'].help_text = "Task tags (e.g., ['frontend', 'bug', 'urgent']). Leave as [] for no tags."
-            self.fields['tags'].required = False
+
+def _change_url(viewname, pk):
+    """Admin change URL for `pk` without walking the URL resolver per row"""
+    return _change_url_template(viewname, get_script_prefix()).format(pk)
+
+
+def _change_link(viewname, pk, text):
+    """<a> tag to the admin change view of `pk`, escaping only `text`"""
+    return mark_safe(CHANGE_LINK_TEMPLATE.format(url=_change_url(viewname, pk), text=escape(text)))
+
+
+def _is_changelist(request):
+    """Whether `request` renders an admin changelist (not a change form)"""
+    match = getattr(request, 'resolver_match', None)
+    return bool(match and match.url_name and match.url_name.endswith('_changelist'))
 
 
 class ProjectMembershipInline(admin.TabularInline):
@@ -69,28 +98,13 @@ class ProjectMembershipInline(admin.TabularInline):
     extra = 0
     fields = ['user', 'role', 'is_active', 'assigned_by', 'assigned_at']
     readonly_fields = ['assigned_at']
-
-
-class TaskInline(admin.StackedInline):
-    """Inline editor for project tasks"""
-    model = Task
-    form = TaskAdminForm
-    extra = 0
-    fields = [
-        ('title', 'status', 'priority'),
-        ('assignee', 'due_date'),
-        ('estimated_hours', 'actual_hours'),
-        'description'
-    ]
-    readonly_fields = ['created_at', 'updated_at']
+    autocomplete_fields = ['user', 'assigned_by']
 
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     """Main admin interface for project management"""
     
-    form = ProjectAdminForm
-    
     list_display = [
         'project_icon',
         'name',
@@ -123,11 +137,24 @@ class ProjectAdmin(admin.ModelAdmin):
         'created_by__email'
     ]
     
+    # Skip the unfiltered COUNT(*) behind the "N total" hint; on this
+    # annotated queryset it is a full GROUP BY over tasks and memberships
+    show_full_result_count = False
+    
+    autocomplete_fields = ['workspace', 'project_manager', 'created_by']
+    
+    ordering = ['-created_at']
+    list_per_page = 25
+    # Plain columns only: sorting by an annotated column re-sorts the whole
+    # GROUP BY result instead of walking an index
+    sortable_by = ('name', 'status', 'priority', 'due_date', 'created_at')
+    
     readonly_fields = [
         'id',
         'slug',
         'progress_percentage',
         'task_summary',
+        'task_list_link',
         'team_summary', 
         'created_at',
         'updated_at'
@@ -148,7 +175,7 @@ class ProjectAdmin(admin.ModelAdmin):
             'classes': ['collapse']
         }),
         ('📊 Progress', {
-            'fields': ('progress_percentage', 'task_summary', 'team_summary'),
+            'fields': ('progress_percentage', 'task_summary', 'task_list_link', 'team_summary'),
         }),
         ('🏷️ Organization', {
             'fields': ('tags', 'settings'),
@@ -161,104 +188,81 @@ class ProjectAdmin(admin.ModelAdmin):
         })
     )
     
-    inlines = [ProjectMembershipInline, TaskInline]
+    # Tasks are not inlined: a large project would render a form per task.
+    # task_list_link points to the Task changelist filtered to this project.
+    inlines = [ProjectMembershipInline]
     
     actions = ['mark_completed', 'archive_projects', 'calculate_progress']
     
     def get_queryset(self, request):
         """Optimize queries with annotations"""
-        return super().get_queryset(request).select_related(
-            'workspace', 'workspace__organization', 'project_manager', 'created_by'
-        ).prefetch_related(
-            'tasks', 'memberships__user'
-        ).annotate(
-            total_tasks=Count('tasks', filter=Q(tasks__deleted_at__isnull=True)),
-            completed_tasks=Count('tasks', filter=Q(
-                tasks__deleted_at__isnull=True,
-                tasks__status__in=[Task.Status.COMPLETED, Task.Status.VERIFIED]
-            ))
+        queryset = super().get_queryset(request)
+        if _is_changelist(request):
+            # Large text/JSON columns are only shown on the change form
+            queryset = queryset.defer('description', 'tags', 'settings')
+        return queryset.select_related('workspace').annotate(
+            # Only the manager's email is shown; skip building User rows
+            _pm_email=F('project_manager__email'),
+            # Correlated COUNT: no memberships join to GROUP BY over
+            active_member_count=Coalesce(
+                Subquery(
+                    ProjectMembership.objects.filter(
+                        project=OuterRef('pk'), is_active=True
+                    ).values('project').annotate(c=Count('pk')).values('c')
+                ),
+                0
+            ),
+            # NULL when there is no due date
+            days_left_db=ExpressionWrapper(
+                F('due_date') - TruncDate(Now()), output_field=DurationField()
+            )
         )
     
     def project_icon(self, obj):
         """Display project with priority-based color coding"""
-        priority_colors = {
-            'low': '#6B7280',      
-            'medium': '#3B82F6',    
-            'high': '#F59E0B',     
-            'urgent': '#EF4444',   
-            'critical': '#DC2626'  
-        }
-        
-        color = priority_colors.get(obj.priority, '#3B82F6')
-        
-        status_icons = {
-            'planning': '📋',
-            'active': '🚀',
-            'on_hold': '⏸️',
-            'completed': '✅',
-            'cancelled': '❌',
-            'archived': '📦'
-        }
+        color = PROJECT_PRIORITY_COLORS.get(obj.priority, '#3B82F6')
+        icon = PROJECT_STATUS_ICONS.get(obj.status, '📂')
         
-        icon = status_icons.get(obj.status, '📂')
-        
-        return format_html(
-            '<div style="display:flex;align-items:center;">'
-            '<div style="width:20px;height:20px;background:{};border-radius:3px;display:flex;align-items:center;justify-content:center;margin-right:8px;font-size:12px;">{}</div>'
-            '</div>',
-            color,
-            icon
-        )
+        return mark_safe(PROJECT_ICON_TEMPLATE.format(color=color, icon=icon))
     project_icon.short_description = ''
     
     def workspace_link(self, obj):
         """Link to workspace admin"""
-        url = reverse('admin:workspaces_workspace_change', args=[obj.workspace.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.workspace.name)
+        return _change_link('admin:workspaces_workspace_change', obj.workspace.pk, obj.workspace.name)
     workspace_link.short_description = "Workspace"
     
     def progress_bar(self, obj):
         """Visual progress bar"""
+        # Maintained with the task counters, rounded like progress_from_counts
         progress = obj.progress_percentage
         color = '#10B981' if progress >= 80 else '#F59E0B' if progress >= 50 else '#EF4444'
         
-        return format_html(
-            '<div style="width:100px;background:#E5E7EB;border-radius:10px;height:16px;">'
-            '<div style="width:{}%;background:{};border-radius:10px;height:16px;display:flex;align-items:center;justify-content:center;color:white;font-size:10px;font-weight:bold;">{}%</div>'
-            '</div>',
-            progress, color, progress
-        )
+        return mark_safe(PROGRESS_BAR_TEMPLATE.format(pct=progress, color=color))
     progress_bar.short_description = "Progress"
     
     def project_manager_email(self, obj):
         """Link to project manager"""
-        if obj.project_manager:
-            url = reverse('admin:users_user_change', args=[obj.project_manager.pk])
-            return format_html('<a href="{}">{}</a>', url, obj.project_manager.email)
+        if obj.project_manager_id:
+            return _change_link('admin:users_user_change', obj.project_manager_id, obj._pm_email)
         return "Unassigned"
     project_manager_email.short_description = "Project Manager"
     
     def task_count(self, obj):
         """Show task count with status breakdown"""
-        total = getattr(obj, 'total_tasks', obj.tasks.filter(deleted_at__isnull=True).count())
-        completed = getattr(obj, 'completed_tasks', obj.tasks.filter(
-            deleted_at__isnull=True,
-            status__in=[Task.Status.COMPLETED, Task.Status.VERIFIED]
-        ).count())
-        
-        return f"{completed}/{total} tasks"
+        return f"{obj.task_completed}/{obj.task_total} tasks"
     task_count.short_description = "Tasks"
     
     def days_remaining_display(self, obj):
         """Show days until due date with color coding"""
-        days = obj.days_remaining
-        if days is None:
+        if obj.days_left_db is None:
             return "No due date"
         
+        days = obj.days_left_db.days
+        
         if days < 0:
             return format_html('<span style="color: red;">Overdue by {} days</span>', abs(days))
         elif days == 0:
-            return format_html('<span style="color: orange;">Due today</span>')
+            return mark_safe('<span style="color: orange;">Due today</span>')
         elif days <= 7:
             return format_html('<span style="color: orange;">{} days left</span>', days)
         else:
@@ -267,25 +271,28 @@ class ProjectAdmin(admin.ModelAdmin):
     
     def task_summary(self, obj):
         """Summary of project tasks"""
-        total = obj.tasks.filter(deleted_at__isnull=True).count()
-        if total == 0:
+        # The counters tell whether there are tasks without a query
+        if not obj.task_total:
             return "No tasks yet"
         
-        status_counts = obj.get_task_counts_by_status()
-        summary_parts = []
-        
-        for status_data in status_counts:
-            status = status_data['status']
-            count = status_data['count']
-            summary_parts.append(f"{status}: {count}")
+        # One GROUP BY query for the full per-status breakdown
+        summary_parts = [
+            f"{status_data['status']}: {status_data['count']}"
+            for status_data in obj.get_task_counts_by_status()
+        ]
         
         return " | ".join(summary_parts)
     task_summary.short_description = "Task Breakdown"
     
+    def task_list_link(self, obj):
+        """Link to the task changelist filtered to this project"""
+        url = reverse('admin:projects_task_changelist')
+        return format_html('<a href="{}?project__id__exact={}">View {} tasks</a>', url, obj.pk, obj.task_total)
+    task_list_link.short_description = "Tasks"
+    
     def team_summary(self, obj):
         """Summary of project team"""
-        active_members = obj.memberships.filter(is_active=True).count()
-        return f"{active_members} team members"
+        return f"{obj.active_member_count} team members"
     team_summary.short_description = "Team Size"
 
 
@@ -293,8 +300,6 @@ class ProjectAdmin(admin.ModelAdmin):
 class TaskAdmin(admin.ModelAdmin):
     """Admin interface for task management"""
     
-    form = TaskAdminForm
-    
     list_display = [
         'task_icon',
         'title',
@@ -324,6 +329,14 @@ class TaskAdmin(admin.ModelAdmin):
         'created_by__email'
     ]
     
+    show_full_result_count = False
+    
+    autocomplete_fields = ['project', 'assignee', 'created_by']
+    
+    ordering = ['-created_at']
+    list_per_page = 25
+    sortable_by = ('title', 'status', 'priority', 'due_date')
+    
     readonly_fields = [
         'id',
         'is_overdue_display',
@@ -359,82 +372,70 @@ class TaskAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         """Optimize queries"""
-        return super().get_queryset(request).select_related(
-            'project', 'project__workspace', 'assignee', 'created_by'
+        queryset = super().get_queryset(request)
+        if _is_changelist(request):
+            queryset = queryset.defer(
+                'description', 'acceptance_criteria', 'tags',
+                'project__description', 'project__tags', 'project__settings'
+            )
+        return queryset.select_related('project').annotate(
+            _assignee_email=F('assignee__email'),
+            _created_by_email=F('created_by__email'),
+            is_overdue_db=Task.objects.overdue_expression(),
+            days_left_db=ExpressionWrapper(F('due_date') - Now(), output_field=DurationField()),
+            _over_estimate=Case(
+                When(actual_hours__gt=F('estimated_hours'), then=True),
+                default=False,
+                output_field=BooleanField()
+            )
         )
     
     def task_icon(self, obj):
         """Display task with status-based color"""
-        status_colors = {
-            'todo': '#6B7280',         
-            'in_progress': '#3B82F6',  
-            'in_review': '#F59E0B',    
-            'blocked': '#EF4444',      
-            'completed': '#10B981',    
-            'verified': '#059669'      
-        }
-        
-        color = status_colors.get(obj.status, '#6B7280')
+        color = TASK_STATUS_COLORS.get(obj.status, '#6B7280')
+        indicator = TASK_PRIORITY_INDICATORS.get(obj.priority, '●')
         
-        priority_indicators = {
-            'low': '●',
-            'medium': '●●', 
-            'high': '●●●',
-            'urgent': '🔥',
-        }
-        
-        indicator = priority_indicators.get(obj.priority, '●')
-        
-        return format_html(
-            '<span style="color: {}; font-size: 14px;">{}</span>',
-            color, indicator
-        )
+        return mark_safe(TASK_ICON_TEMPLATE.format(color=color, indicator=indicator))
     task_icon.short_description = ''
     
     def project_link(self, obj):
         """Link to project admin"""
-        url = reverse('admin:projects_project_change', args=[obj.project.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.project.name)
+        return _change_link('admin:projects_project_change', obj.project.pk, obj.project.name)
     project_link.short_description = "Project"
     
     def assignee_email(self, obj):
         """Link to assignee user admin"""
-        if obj.assignee:
-            url = reverse('admin:users_user_change', args=[obj.assignee.pk])
-            return format_html('<a href="{}">{}</a>', url, obj.assignee.email)
+        if obj.assignee_id:
+            return _change_link('admin:users_user_change', obj.assignee_id, obj._assignee_email)
         return "Unassigned"
     assignee_email.short_description = "Assignee"
     
     def created_by_email(self, obj):
         """Link to creator user admin"""
-        url = reverse('admin:users_user_change', args=[obj.created_by.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.created_by.email)
+        return _change_link('admin:users_user_change', obj.created_by_id, obj._created_by_email)
     created_by_email.short_description = "Created By"
     
     def is_overdue_display(self, obj):
         """Show overdue status with visual indicator"""
-        if obj.is_overdue:
-            return format_html('<span style="color: red; font-weight: bold;">⚠️ OVERDUE</span>')
-        elif obj.due_date:
-            days_left = (obj.due_date - timezone.now()).days
-            if days_left <= 1:
-                return format_html('<span style="color: orange;">⏰ Due soon</span>')
+        if obj.is_overdue_db:
+            return mark_safe('<span style="color: red; font-weight: bold;">⚠️ OVERDUE</span>')
+        elif obj.days_left_db is not None:
+            if obj.days_left_db.days <= 1:
+                return mark_safe('<span style="color: orange;">⏰ Due soon</span>')
         return "On track"
     is_overdue_display.short_description = "Due Status"
     
     def estimated_vs_actual(self, obj):
         """Compare estimated vs actual hours"""
         if obj.estimated_hours and obj.actual_hours:
-            if obj.actual_hours > obj.estimated_hours:
-                return format_html(
-                    '<span style="color: red;">{:.1f}h / {:.1f}h (over)</span>',
-                    obj.actual_hours, obj.estimated_hours
-                )
-            else:
-                return format_html(
-                    '<span style="color: green;">{:.1f}h / {:.1f}h</span>',
-                    obj.actual_hours, obj.estimated_hours
-                )
+            # Decimals go through str.format directly: format_html would escape
+            # them to strings first, which breaks the :.1f format spec
+            return mark_safe(HOURS_TEMPLATE.format(
+                color='red' if obj._over_estimate else 'green',
+                actual=obj.actual_hours,
+                estimated=obj.estimated_hours,
+                suffix=' (over)' if obj._over_estimate else ''
+            ))
         elif obj.estimated_hours:
             return f"{obj.estimated_hours}h (estimated)"
         elif obj.actual_hours:
@@ -469,18 +470,28 @@ class ProjectMembershipAdmin(admin.ModelAdmin):
         'project__workspace__name'
     ]
     
+    show_full_result_count = False
+    
+    autocomplete_fields = ['user', 'project', 'assigned_by']
+    
+    def get_queryset(self, request):
+        """User email and project/workspace names are joined in as columns, not rows"""
+        return super().get_queryset(request).annotate(
+            _user_email=F('user__email'),
+            _project_name=F('project__name'),
+            _workspace_name=F('project__workspace__name')
+        )
+    
     def user_email(self, obj):
-        url = reverse('admin:users_user_change', args=[obj.user.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.user.email)
+        return _change_link('admin:users_user_change', obj.user_id, obj._user_email)
     user_email.short_description = "User"
     
     def project_name(self, obj):
-        url = reverse('admin:projects_project_change', args=[obj.project.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.project.name)
+        return _change_link('admin:projects_project_change', obj.project_id, obj._project_name)
     project_name.short_description = "Project"
     
     def workspace_name(self, obj):
-        return obj.project.workspace.name
+        return obj._workspace_name
     workspace_name.short_description = "Workspace"
 
 
@@ -507,19 +518,26 @@ class TaskDependencyAdmin(admin.ModelAdmin):
         'from_task__project__name'
     ]
     
+    show_full_result_count = False
+    
+    autocomplete_fields = ['from_task', 'to_task', 'created_by']
+    
+    list_select_related = ('from_task', 'to_task')
+    
+    def get_queryset(self, request):
+        """Only the creator's email is shown; skip building User rows"""
+        return super().get_queryset(request).annotate(_created_by_email=F('created_by__email'))
+    
     def from_task_title(self, obj):
-        url = reverse('admin:projects_task_change', args=[obj.from_task.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.from_task.title)
+        return _change_link('admin:projects_task_change', obj.from_task.pk, obj.from_task.title)
     from_task_title.short_description = "From Task"
     
     def to_task_title(self, obj):
-        url = reverse('admin:projects_task_change', args=[obj.to_task.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.to_task.title)
+        return _change_link('admin:projects_task_change', obj.to_task.pk, obj.to_task.title)
     to_task_title.short_description = "To Task"
     
     def created_by_email(self, obj):
-        if obj.created_by:
-            url = reverse('admin:users_user_change', args=[obj.created_by.pk])
-            return format_html('<a href="{}">{}</a>', url, obj.created_by.email)
+        if obj.created_by_id:
+            return _change_link('admin:users_user_change', obj.created_by_id, obj._created_by_email)
         return "System"
     created_by_email.short_description = "Created By"
\ No newline at end of file
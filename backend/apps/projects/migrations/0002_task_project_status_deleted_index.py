@@ -0,0 +1,21 @@
+# Generated by Django 4.2.8 on 2026-10-15 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='projects_ta_project_cd2085_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'deleted_at'], name='projects_ta_project_a3a90a_idx'),
+        ),
+    ]
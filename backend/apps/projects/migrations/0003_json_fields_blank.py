@@ -0,0 +1,28 @@
+# Generated by Django 4.2.8 on 2026-10-15 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_task_project_status_deleted_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='project',
+            name='settings',
+            field=models.JSONField(blank=True, default=dict, help_text='Project settings JSON. Leave as {} for defaults.'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='tags',
+            field=models.JSONField(blank=True, default=list, help_text="Project tags (e.g., ['web', 'mobile', 'urgent']). Leave as [] for no tags."),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='tags',
+            field=models.JSONField(blank=True, default=list, help_text="Task tags (e.g., ['frontend', 'bug', 'urgent']). Leave as [] for no tags."),
+        ),
+    ]
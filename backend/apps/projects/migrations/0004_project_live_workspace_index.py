@@ -0,0 +1,17 @@
+# Generated by Django 4.2.8 on 2026-10-15 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_json_fields_blank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['workspace'], name='proj_live_ws_idx'),
+        ),
+    ]
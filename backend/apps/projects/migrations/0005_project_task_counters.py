@@ -0,0 +1,57 @@
+# Generated by Django 4.2.8 on 2026-10-15 23:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_task_counters(apps, schema_editor):
+    """Populate the task counters for existing projects"""
+    Project = apps.get_model('projects', 'Project')
+    Task = apps.get_model('projects', 'Task')
+
+    def active_tasks(**filters):
+        tasks = Task.objects.filter(
+            project=OuterRef('pk'),
+            deleted_at__isnull=True,
+            **filters
+        ).values('project').annotate(total=Count('pk')).values('total')
+        return Coalesce(Subquery(tasks), 0)
+
+    Project.objects.update(
+        task_total=active_tasks(),
+        task_completed=active_tasks(status__in=['completed', 'verified']),
+        task_in_progress=active_tasks(status='in_progress'),
+        task_blocked=active_tasks(status='blocked')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_live_workspace_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='task_blocked',
+            field=models.PositiveIntegerField(default=0, help_text='Cached number of blocked tasks'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_completed',
+            field=models.PositiveIntegerField(default=0, help_text='Cached number of completed or verified tasks'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_in_progress',
+            field=models.PositiveIntegerField(default=0, help_text='Cached number of in-progress tasks'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='task_total',
+            field=models.PositiveIntegerField(default=0, help_text='Cached number of active tasks'),
+        ),
+        migrations.RunPython(backfill_task_counters, migrations.RunPython.noop),
+    ]
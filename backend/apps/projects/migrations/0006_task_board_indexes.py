@@ -0,0 +1,29 @@
+# Generated by Django 4.2.8 on 2026-10-15 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_task_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='projects_ta_assigne_df8978_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='projects_ta_priorit_b272ad_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', '-priority', 'due_date', 'created_at'], name='task_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['assignee', 'status'], name='task_assignee_live_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# GIN indexes are PostgreSQL-only, so they are created here rather than in
+# Meta.indexes, which would also be built on the SQLite test database.
+TAG_INDEXES = [
+    ('proj_tags_gin', 'projects_project'),
+    ('task_tags_gin', 'projects_task'),
+]
+
+
+def create_tag_indexes(apps, schema_editor):
+    """GIN (jsonb_path_ops) indexes serving tags__contains lookups"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table in TAG_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("tags" jsonb_path_ops)'
+        )
+
+
+def drop_tag_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table in TAG_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_task_board_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_tag_indexes, drop_tag_indexes),
+    ]
@@ -5,7 +5,9 @@ Fixed the ManyToMany through_fields issue for Project.team_members.
 """
 
 import uuid
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Now, TruncDate
+from django.db.models.lookups import Exact
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.utils.text import slugify
@@ -13,6 +15,8 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 
+from apps.core.slugs import save_with_unique_slug
+
 User = get_user_model()
 
 
@@ -82,6 +86,113 @@ class ProjectMembership(models.Model):
         return f"{self.user.email} → {self.project.name} ({self.role})"
 
 
+class ProjectManager(models.Manager):
+    """Custom manager for Project model with common queries"""
+    
+    def for_list(self):
+        """
+        Projects without description, tags and settings, for list and
+        board views that only show identity, status, dates and task counts.
+        """
+        return self.get_queryset().only(
+            'id', 'name', 'slug', 'status', 'priority', 'workspace_id',
+            'due_date', 'progress_percentage', 'task_total', 'task_completed',
+            'task_in_progress', 'task_blocked', 'created_at', 'updated_at'
+        )
+    
+    def overdue_expression(self):
+        """Project.is_overdue as a SQL expression on the database date"""
+        return models.Case(
+            models.When(
+                ~models.Q(status__in=Project.CLOSED_STATUSES),
+                due_date__lt=TruncDate(Now()),
+                then=models.Value(True)
+            ),
+            default=models.Value(False),
+            output_field=models.BooleanField()
+        )
+    
+    def with_overdue(self):
+        """
+        Annotate `is_overdue_db`, so lists can filter and sort on it and
+        is_overdue reads it instead of computing per row.
+        """
+        return self.get_queryset().annotate(is_overdue_db=self.overdue_expression())
+    
+    def with_active_members(self):
+        """
+        Prefetch each project's active memberships with their users into
+        `active_memberships`. Unlike iterating team_members, this keeps the
+        role and costs 2 queries for any number of projects.
+        """
+        return self.get_queryset().prefetch_related(
+            models.Prefetch(
+                'memberships',
+                queryset=ProjectMembership.objects.filter(is_active=True).select_related('user'),
+                to_attr='active_memberships'
+            )
+        )
+    
+    def recompute_progress(self, project_ids, batch_size=500):
+        """
+        Refresh progress_percentage for many projects at once (imports,
+        bulk task updates, repair scripts).
+        
+        One GROUP BY over active tasks replaces the per-project counts of
+        calculate_progress_percentage(); only projects whose value changed
+        are written, via bulk_update. Returns the number of projects updated.
+        """
+        project_ids = list(project_ids)
+        counts = {
+            row['project_id']: row
+            for row in Task.objects.filter(
+                project_id__in=project_ids,
+                deleted_at__isnull=True
+            ).values('project_id').annotate(
+                total=models.Count('id'),
+                completed=models.Count('id', filter=models.Q(status__in=Task.DONE_STATUSES))
+            ).order_by()
+        }
+        
+        changed = []
+        for project in self.filter(id__in=project_ids).only('id', 'progress_percentage'):
+            row = counts.get(project.id)
+            progress = Project.progress_from_counts(row['total'], row['completed']) if row else 0
+            if project.progress_percentage != progress:
+                project.progress_percentage = progress
+                changed.append(project)
+        
+        self.bulk_update(changed, ['progress_percentage'], batch_size=batch_size)
+        return len(changed)
+    
+    @transaction.atomic
+    def soft_delete_bulk(self, queryset, now=None):
+        """
+        Archive and soft delete every project in `queryset` together with
+        their active tasks (e.g. archiving a whole workspace).
+        
+        Two set-based UPDATEs replace a save() per project, so no model
+        signals are sent; the task counters are zeroed in the same statement.
+        Runs in one transaction, so projects are never archived with live tasks.
+        Returns the number of projects soft deleted.
+        """
+        now = now or timezone.now()
+        project_ids = list(queryset.filter(deleted_at__isnull=True).values_list('id', flat=True))
+        
+        updated = self.filter(id__in=project_ids).update(
+            deleted_at=now,
+            status=Project.Status.ARCHIVED,
+            task_total=0,
+            task_completed=0,
+            task_in_progress=0,
+            task_blocked=0
+        )
+        Task.objects.filter(project_id__in=project_ids, deleted_at__isnull=True).update(
+            deleted_at=now
+        )
+        return updated
+
+
 class Project(models.Model):
     """
     Primary work container within workspaces.
@@ -108,6 +219,9 @@ class Project(models.Model):
         URGENT = 'urgent', 'Urgent'
         CRITICAL = 'critical', 'Critical'
     
+    # Statuses that can no longer become overdue
+    CLOSED_STATUSES = (Status.COMPLETED, Status.CANCELLED, Status.ARCHIVED)
+    
     # Primary identification
     id = models.UUIDField(
         primary_key=True,
@@ -206,6 +320,25 @@ class Project(models.Model):
         help_text="Project completion percentage (0-100)"
     )
     
+    # Denormalized counts of active (non-deleted) tasks, kept in sync by the
+    # Task signals so boards need no per-project GROUP BY
+    task_total = models.PositiveIntegerField(
+        default=0,
+        help_text="Cached number of active tasks"
+    )
+    task_completed = models.PositiveIntegerField(
+        default=0,
+        help_text="Cached number of completed or verified tasks"
+    )
+    task_in_progress = models.PositiveIntegerField(
+        default=0,
+        help_text="Cached number of in-progress tasks"
+    )
+    task_blocked = models.PositiveIntegerField(
+        default=0,
+        help_text="Cached number of blocked tasks"
+    )
+    
     # Team and collaboration - FIXED: specify through_fields
     team_members = models.ManyToManyField(
         User,
@@ -218,11 +351,13 @@ class Project(models.Model):
     # Metadata and organization
     tags = models.JSONField(
         default=list,
-        help_text="Project tags for categorization and filtering"
+        blank=True,
+        help_text="Project tags (e.g., ['web', 'mobile', 'urgent']). Leave as [] for no tags."
     )
     settings = models.JSONField(
         default=dict,
-        help_text="Project-specific settings and preferences"
+        blank=True,
+        help_text="Project settings JSON. Leave as {} for defaults."
     )
     
     # Timestamps
@@ -230,6 +365,8 @@ class Project(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
     
+    objects = ProjectManager()
+    
     class Meta:
         db_table = 'projects_project'
         verbose_name = 'Project'
@@ -237,10 +374,18 @@ class Project(models.Model):
         unique_together = ['workspace', 'slug']  # Slug unique within workspace
         indexes = [
             models.Index(fields=['workspace', 'status']),
+            # Live projects per workspace (project limit check, project_count)
+            models.Index(
+                fields=['workspace'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='proj_live_ws_idx'
+            ),
             models.Index(fields=['project_manager']),
             models.Index(fields=['due_date', 'status']),
             models.Index(fields=['priority', 'status']),
             models.Index(fields=['created_at']),
+            # tags__contains is served by the PostgreSQL-only GIN index
+            # created in migration 0007_tags_gin_indexes
         ]
         ordering = ['-created_at']
     
@@ -250,20 +395,16 @@ class Project(models.Model):
     def save(self, *args, **kwargs):
         """Auto-generate slug and validate business rules"""
         # Auto-generate slug from name if not provided
-        if not self.slug:
-            self.slug = slugify(self.name)
-            
-            # Ensure slug uniqueness within workspace
-            counter = 1
-            original_slug = self.slug
-            while Project.objects.filter(
-                workspace=self.workspace,
-                slug=self.slug
-            ).exclude(id=self.id).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+        if self.slug:
+            return super().save(*args, **kwargs)
         
-        super().save(*args, **kwargs)
+        # Slugs are unique within the workspace
+        return save_with_unique_slug(
+            self,
+            Project.objects.filter(workspace_id=self.workspace_id).exclude(id=self.id),
+            slugify(self.name),
+            super().save, *args, fallback='project', **kwargs
+        )
     
     def clean(self):
         """Enterprise validation for business rules"""
@@ -271,7 +412,7 @@ class Project(models.Model):
         
         # Rule 1: Check workspace project limits
         if not self.pk:  # Only for new projects
-            org_limits = self.workspace.organization.get_usage_limits()
+            org_limits = self.workspace.organization.get_cached_usage_limits()
             current_projects = self.workspace.projects.filter(deleted_at__isnull=True).count()
             
             if current_projects >= org_limits['max_projects_per_workspace']:
@@ -289,11 +430,11 @@ class Project(models.Model):
     @property
     def is_overdue(self):
         """Check if project is past its due date"""
+        if hasattr(self, 'is_overdue_db'):
+            return self.is_overdue_db
         if not self.due_date:
             return False
-        return timezone.now().date() > self.due_date and self.status not in [
-            self.Status.COMPLETED, self.Status.CANCELLED, self.Status.ARCHIVED
-        ]
+        return timezone.now().date() > self.due_date and self.status not in self.CLOSED_STATUSES
     
     @property
     def days_remaining(self):
@@ -311,21 +452,42 @@ class Project(models.Model):
         """Get task counts grouped by status for progress tracking"""
         return self.get_active_tasks().values('status').annotate(
             count=models.Count('id')
+        ).order_by('status')
+    
+    def get_task_counter_summary(self):
+        """
+        Active task counts from the maintained task counters, without a
+        query. Statuses without their own counter are summed as 'other'.
+        """
+        return {
+            'completed': self.task_completed,
+            'in_progress': self.task_in_progress,
+            'blocked': self.task_blocked,
+            'other': max(self.task_total - self.task_completed - self.task_in_progress - self.task_blocked, 0),
+        }
+    
+    @staticmethod
+    def progress_from_counts(total_tasks, completed_tasks):
+        """Completion percentage (0-100) for the given active task counts"""
+        if total_tasks == 0:
+            return 0
+        # Integer rounding half up: the same arithmetic as progress_expression()
+        return (completed_tasks * 200 + total_tasks) // (total_tasks * 2)
+    
+    @staticmethod
+    def progress_expression(total_tasks, completed_tasks):
+        """progress_from_counts() as a SQL expression over count expressions"""
+        return models.Case(
+            models.When(Exact(total_tasks, 0), then=models.Value(0)),
+            default=(completed_tasks * 200 + total_tasks) / (total_tasks * 2),
+            output_field=models.IntegerField()
         )
     
     def calculate_progress_percentage(self):
         """Calculate project progress based on completed tasks"""
-        active_tasks = self.get_active_tasks()
-        total_tasks = active_tasks.count()
-        
-        if total_tasks == 0:
-            return 0
-        
-        completed_tasks = active_tasks.filter(
-            status__in=[Task.Status.COMPLETED, Task.Status.VERIFIED]
-        ).count()
-        
-        progress = round((completed_tasks / total_tasks) * 100)
+        # Read the maintained task counters from the row, not this instance
+        self.refresh_from_db(fields=['task_total', 'task_completed'])
+        progress = self.progress_from_counts(self.task_total, self.task_completed)
         
         # Update the cached field
         if self.progress_percentage != progress:
@@ -340,13 +502,54 @@ class Project(models.Model):
     
     def soft_delete(self):
         """Soft delete project and related tasks"""
-        self.deleted_at = timezone.now()
-        self.status = self.Status.ARCHIVED
-        self.save(update_fields=['deleted_at', 'status'])
+        now = timezone.now()
+        Project.objects.soft_delete_bulk(Project.objects.filter(pk=self.pk), now=now)
         
-        # Soft delete all tasks in this project
-        self.tasks.filter(deleted_at__isnull=True).update(
-            deleted_at=timezone.now()
+        self.deleted_at = now
+        self.status = self.Status.ARCHIVED
+        self.task_total = self.task_completed = self.task_in_progress = self.task_blocked = 0
+
+
+class TaskManager(models.Manager):
+    """Custom manager for Task model with common queries"""
+    
+    def for_board(self):
+        """Tasks without their long text and tags columns, for board/list views"""
+        return self.get_queryset().defer('description', 'acceptance_criteria', 'tags')
+    
+    def overdue_expression(self):
+        """Task.is_overdue as a SQL expression on the database clock"""
+        return models.Case(
+            models.When(
+                ~models.Q(status__in=Task.DONE_STATUSES),
+                due_date__lt=Now(),
+                then=models.Value(True)
+            ),
+            default=models.Value(False),
+            output_field=models.BooleanField()
+        )
+    
+    def with_overdue(self):
+        """
+        Annotate `is_overdue_db`, so boards can filter and sort on it and
+        is_overdue reads it instead of computing per row.
+        """
+        return self.get_queryset().annotate(is_overdue_db=self.overdue_expression())
+    
+    def with_blocking(self):
+        """
+        Prefetch each task's incomplete dependencies. is_blocked and
+        get_blocking_tasks() then read the prefetched rows, so checking N
+        tasks costs 2 queries instead of N+1.
+        """
+        return self.get_queryset().prefetch_related(
+            models.Prefetch(
+                'depends_on',
+                queryset=Task.objects.filter(
+                    deleted_at__isnull=True
+                ).exclude(status__in=Task.DONE_STATUSES),
+                to_attr='_blocking_tasks'
+            )
         )
 
 
@@ -374,6 +577,9 @@ class Task(models.Model):
         HIGH = 'high', 'High'
         URGENT = 'urgent', 'Urgent'
     
+    # Statuses that count as done for progress and dependency checks
+    DONE_STATUSES = (Status.COMPLETED, Status.VERIFIED)
+    
     # Primary identification
     id = models.UUIDField(
         primary_key=True,
@@ -478,7 +684,8 @@ class Task(models.Model):
     # Metadata
     tags = models.JSONField(
         default=list,
-        help_text="Task tags for categorization and filtering"
+        blank=True,
+        help_text="Task tags (e.g., ['frontend', 'bug', 'urgent']). Leave as [] for no tags."
     )
     
     # Timestamps
@@ -486,16 +693,32 @@ class Task(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
     
+    objects = TaskManager()
+    
     class Meta:
         db_table = 'projects_task'
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         indexes = [
-            models.Index(fields=['project', 'status']),
-            models.Index(fields=['assignee', 'status']),
+            # Covers the per-project status/soft-delete counts (admin, progress)
+            models.Index(fields=['project', 'status', 'deleted_at']),
+            # Board query: a project's live tasks in Meta.ordering order,
+            # read straight from the index with no sort step
+            models.Index(
+                fields=['project', '-priority', 'due_date', 'created_at'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='task_board_idx'
+            ),
+            # "My tasks" by status, live tasks only
+            models.Index(
+                fields=['assignee', 'status'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='task_assignee_live_idx'
+            ),
             models.Index(fields=['due_date', 'status']),
-            models.Index(fields=['priority', 'status']),
             models.Index(fields=['created_at']),
+            # tags__contains is served by the PostgreSQL-only GIN index
+            # created in migration 0007_tags_gin_indexes
         ]
         ordering = ['-priority', 'due_date', 'created_at']
     
@@ -516,11 +739,11 @@ class Task(models.Model):
     @property
     def is_overdue(self):
         """Check if task is past its due date"""
+        if hasattr(self, 'is_overdue_db'):
+            return self.is_overdue_db
         if not self.due_date:
             return False
-        return timezone.now() > self.due_date and self.status not in [
-            self.Status.COMPLETED, self.Status.VERIFIED
-        ]
+        return timezone.now() > self.due_date and self.status not in self.DONE_STATUSES
     
     @property
     def is_blocked(self):
@@ -529,22 +752,24 @@ class Task(models.Model):
             return True
         
         # Check if any dependencies are incomplete
-        blocking_tasks = self.depends_on.filter(
-            deleted_at__isnull=True
-        ).exclude(
-            status__in=[self.Status.COMPLETED, self.Status.VERIFIED]
-        )
-        
-        return blocking_tasks.exists()
+        if hasattr(self, '_blocking_tasks'):  # Task.objects.with_blocking()
+            return bool(self._blocking_tasks)
+        return self._blocking_tasks_queryset().exists()
     
-    def get_blocking_tasks(self):
-        """Get tasks that are blocking this task"""
+    def _blocking_tasks_queryset(self):
+        """Incomplete, non-deleted tasks this task depends on"""
         return self.depends_on.filter(
             deleted_at__isnull=True
         ).exclude(
-            status__in=[self.Status.COMPLETED, self.Status.VERIFIED]
+            status__in=self.DONE_STATUSES
         )
     
+    def get_blocking_tasks(self):
+        """Get the list of tasks that are blocking this task"""
+        if hasattr(self, '_blocking_tasks'):  # Task.objects.with_blocking()
+            return list(self._blocking_tasks)
+        return list(self._blocking_tasks_queryset())
+    
     def can_start(self):
         """Check if task can be started (no blocking dependencies)"""
         return not self.is_blocked
@@ -615,12 +840,45 @@ class TaskDependency(models.Model):
         super().clean()
         
         # Rule 1: Task cannot depend on itself
-        if self.from_task == self.to_task:
+        if self.from_task_id and self.from_task_id == self.to_task_id:
             raise ValidationError("Task cannot depend on itself.")
         
         # Rule 2: Both tasks must be in same project
-        if hasattr(self, 'from_task') and hasattr(self, 'to_task'):
-            if self.from_task.project != self.to_task.project:
+        if self.from_task_id and self.to_task_id:
+            if self.from_task.project_id != self.to_task.project_id:
                 raise ValidationError(
                     "Task dependencies must be within the same project."
-                )
\ No newline at end of file
+                )
+            
+            # Rule 3: No cycles, checked in one recursive query
+            if self.creates_cycle():
+                raise ValidationError(
+                    "This dependency would create a circular dependency."
+                )
+    
+    def creates_cycle(self):
+        """
+        Check whether from_task is already reachable from to_task.
+        
+        The dependency graph is walked by a recursive CTE in the database,
+        so the check is a single query however deep the chain goes.
+        """
+        pk_field = Task._meta.pk
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                WITH RECURSIVE reach(task_id) AS (
+                    SELECT to_task_id FROM projects_task_dependency
+                    WHERE from_task_id = %s
+                    UNION
+                    SELECT d.to_task_id FROM projects_task_dependency d
+                    JOIN reach r ON d.from_task_id = r.task_id
+                )
+                SELECT 1 FROM reach WHERE task_id = %s LIMIT 1
+                """,
+                [
+                    pk_field.get_db_prep_value(self.to_task_id, connection),
+                    pk_field.get_db_prep_value(self.from_task_id, connection),
+                ]
+            )
+            return cursor.fetchone() is not None
\ No newline at end of file
@@ -14,6 +14,8 @@ Key Responsibilities:
 - Audit logging for project management activities
 """
 
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 from django.db.models.signals import post_save, pre_delete, post_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
@@ -84,7 +86,7 @@ def project_created_handler(sender, instance, created, **kwargs):
             instance.save(update_fields=['settings'])
         
         # 4. Add project manager as member if specified and different from creator
-        if instance.project_manager and instance.project_manager != instance.created_by:
+        if instance.project_manager_id and instance.project_manager_id != instance.created_by_id:
             ProjectMembership.objects.get_or_create(
                 user=instance.project_manager,
                 project=instance,
@@ -144,11 +146,8 @@ def task_changed_handler(sender, instance, created, **kwargs):
             )
             logger.info(f"Auto-added task assignee {instance.assignee.email} to project {instance.project.name}")
     
-    # 3. Handle status changes and recalculate project progress
+    # 3. Handle status changes (progress follows the task counters)
     if not created:
-        # Always recalculate project progress when task status changes
-        instance.project.calculate_progress_percentage()
-        
         # Check if status changed to completed
         if instance.status in [Task.Status.COMPLETED, Task.Status.VERIFIED]:
             logger.info(
@@ -174,6 +173,130 @@ def task_changed_handler(sender, instance, created, **kwargs):
                     logger.info(f"Unblocked task: {dependent_task.title}")
 
 
+# Project counter field for each task status it counts, besides task_total
+TASK_STATUS_COUNTERS = {
+    Task.Status.COMPLETED: 'task_completed',
+    Task.Status.VERIFIED: 'task_completed',
+    Task.Status.IN_PROGRESS: 'task_in_progress',
+    Task.Status.BLOCKED: 'task_blocked',
+}
+
+
+def _task_counters(status, is_active):
+    """Counters a task with this status and liveness counts toward"""
+    if not is_active:
+        return []
+    counters = ['task_total']
+    if status in TASK_STATUS_COUNTERS:
+        counters.append(TASK_STATUS_COUNTERS[status])
+    return counters
+
+
+# Project columns the task counter handlers write
+PROJECT_COUNTER_FIELDS = [
+    'task_total', 'task_completed', 'task_in_progress', 'task_blocked', 'progress_percentage'
+]
+
+
+def _counter_deltas(old_counters, new_counters):
+    """Per-counter change when a task moves from `old_counters` to `new_counters`"""
+    deltas = {}
+    for counter in old_counters:
+        deltas[counter] = deltas.get(counter, 0) - 1
+    for counter in new_counters:
+        deltas[counter] = deltas.get(counter, 0) + 1
+    return {counter: delta for counter, delta in deltas.items() if delta}
+
+
+def _update_project_counters(project_id, deltas):
+    """
+    Apply counter `deltas` to a project with one F() UPDATE (never below 0)
+    that also recomputes progress_percentage from the new counts.
+    Returns whether anything was written.
+    """
+    if not deltas:
+        return False
+    
+    counters = {
+        counter: Greatest(F(counter) + delta, 0) for counter, delta in deltas.items()
+    }
+    Project.objects.filter(pk=project_id).update(
+        progress_percentage=Project.progress_expression(
+            counters.get('task_total', F('task_total')),
+            counters.get('task_completed', F('task_completed'))
+        ),
+        **counters
+    )
+    return True
+
+
+def _refresh_loaded_project(task, project_ids):
+    """Re-read the counters on the task's loaded project if it was just updated"""
+    if Task._meta.get_field('project').is_cached(task) and task.project_id in project_ids:
+        task.project.refresh_from_db(fields=PROJECT_COUNTER_FIELDS)
+
+
+@receiver(pre_save, sender=Task)
+def task_counter_state_handler(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored project/status/deleted_at of a task about to be updated"""
+    if kwargs.get('raw') or instance._state.adding:
+        return
+    if update_fields is not None and not {
+        'project', 'project_id', 'status', 'deleted_at'
+    } & set(update_fields):
+        return
+    
+    instance._counter_state = Task.objects.filter(pk=instance.pk).values_list(
+        'project_id', 'status', 'deleted_at'
+    ).first()
+
+
+@receiver(post_save, sender=Task)
+def task_counter_handler(sender, instance, created, **kwargs):
+    """
+    Keep the Project task counters and progress in sync with its tasks.
+    
+    Only creates and saves that actually change the project, status or
+    deleted_at touch the project rows, as atomic F() deltas. Fixture loads
+    (raw saves) already carry the counters and are skipped.
+    """
+    if kwargs.get('raw'):
+        return
+    new_counters = _task_counters(instance.status, instance.deleted_at is None)
+    
+    if created:
+        old_project_id, old_counters = instance.project_id, []
+    else:
+        old_state = instance.__dict__.pop('_counter_state', None)
+        if old_state is None:
+            return
+        old_project_id, old_status, old_deleted_at = old_state
+        old_counters = _task_counters(old_status, old_deleted_at is None)
+    
+    if old_project_id == instance.project_id:
+        changes = {instance.project_id: _counter_deltas(old_counters, new_counters)}
+    else:
+        # Moved to another project: leave the old one, join the new one
+        changes = {
+            old_project_id: _counter_deltas(old_counters, []),
+            instance.project_id: _counter_deltas([], new_counters),
+        }
+    
+    updated = {
+        project_id for project_id, deltas in changes.items()
+        if _update_project_counters(project_id, deltas)
+    }
+    _refresh_loaded_project(instance, updated)
+
+
+@receiver(post_delete, sender=Task)
+def task_removed_counter_handler(sender, instance, **kwargs):
+    """Decrement the project's task counters for a deleted active task"""
+    deltas = _counter_deltas(_task_counters(instance.status, instance.deleted_at is None), [])
+    if _update_project_counters(instance.project_id, deltas):
+        _refresh_loaded_project(instance, {instance.project_id})
+
+
 @receiver(post_save, sender=TaskDependency)
 def dependency_created_handler(sender, instance, created, **kwargs):
     """
@@ -233,8 +356,5 @@ def task_deleting_handler(sender, instance, **kwargs):
     
     # Remove all dependencies involving this task
     TaskDependency.objects.filter(
-        models.Q(from_task=instance) | models.Q(to_task=instance)
-    ).delete()
-    
-    # Update project progress after task deletion
-    instance.project.calculate_progress_percentage()
\ No newline at end of file
+        Q(from_task=instance) | Q(to_task=instance)
+    ).delete()
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+NexusPM Enterprise - Password Hashers
+
+Argon2 hasher with cost parameters taken from settings instead of
+Django's built-in defaults, so the hashing cost can be sized to the
+production hardware.
+
+Because the algorithm name stays 'argon2', existing hashes keep
+verifying. Django's must_update() compares the stored parameters with
+the configured ones, so a successful check_password() transparently
+rehashes the password whenever the costs are changed.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher driven by ARGON2_TIME_COST, ARGON2_MEMORY_COST
+    and ARGON2_PARALLELISM settings.
+    """
+    time_cost = getattr(settings, 'ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+    memory_cost = getattr(settings, 'ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+    parallelism = getattr(settings, 'ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
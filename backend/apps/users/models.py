@@ -16,8 +16,10 @@ Architecture:
 """
 
 import uuid
+from django.apps import apps
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.cache import cache
 from django.core.validators import RegexValidator
 from django.utils import timezone
 
@@ -68,10 +70,34 @@ class UserManager(BaseUserManager):
         return self.get_queryset().filter(is_email_verified=True)
     
     def by_organization(self, organization_id):
-        """Get users belonging to a specific organization"""
+        """
+        Get users with an active membership in a specific organization.
+        Uses an EXISTS subquery, so no JOIN fan-out and no DISTINCT sort.
+        """
+        OrganizationMembership = apps.get_model('organizations', 'OrganizationMembership')
         return self.get_queryset().filter(
-            memberships__workspace__organization_id=organization_id
-        ).distinct()
+            models.Exists(
+                OrganizationMembership.objects.filter(
+                    user=models.OuterRef('pk'),
+                    organization_id=organization_id,
+                    is_active=True
+                )
+            )
+        )
+    
+    def sharing_organizations_with(self, user):
+        """
+        Get users who share at least one active organization with `user`.
+        Resolved in a single query via a correlated EXISTS subquery.
+        """
+        OrganizationMembership = apps.get_model('organizations', 'OrganizationMembership')
+        shared = OrganizationMembership.objects.filter(
+            user=models.OuterRef('pk'),
+            is_active=True,
+            organization__memberships__user=user,
+            organization__memberships__is_active=True
+        )
+        return self.get_queryset().filter(models.Exists(shared))
     
     def search(self, query):
         """
@@ -84,6 +110,35 @@ class UserManager(BaseUserManager):
             models.Q(email__icontains=query)
         )
     
+    def with_organizations_count(self):
+        """
+        Annotate each user with the number of active organization memberships.
+        Lets list views read `organizations_count` without a COUNT per row.
+        """
+        return self.get_queryset().annotate(
+            organizations_count=models.Count(
+                'organization_memberships',
+                filter=models.Q(organization_memberships__is_active=True)
+            )
+        )
+
+    def with_active_memberships(self):
+        """
+        Prefetch active organization memberships (with their organization)
+        into `active_memberships`, so serializing many users costs one
+        extra query instead of one per user.
+        """
+        OrganizationMembership = apps.get_model('organizations', 'OrganizationMembership')
+        return self.get_queryset().prefetch_related(
+            models.Prefetch(
+                'organization_memberships',
+                queryset=OrganizationMembership.objects.filter(
+                    is_active=True
+                ).select_related('organization'),
+                to_attr='active_memberships'
+            )
+        )
+
     def with_deleted(self):
         """Include soft-deleted users in queries (for admin/audit purposes)"""
         return super().get_queryset()
@@ -318,6 +373,31 @@ class User(AbstractUser):
         self.is_active = True
         self.save(update_fields=['deleted_at', 'is_active'])
     
+    # Cached access lookups
+    ORGANIZATION_IDS_CACHE_TTL = 30  # seconds
+    
+    @staticmethod
+    def organization_ids_cache_key(user_id):
+        """Cache key for a user's active organization ids"""
+        return f"user:orgs:{user_id}"
+    
+    def get_organization_ids(self):
+        """
+        Get the ids of organizations this user is an active member of.
+        Cached briefly since every access check needs it; membership
+        signals invalidate the entry when it changes.
+        """
+        key = self.organization_ids_cache_key(self.pk)
+        organization_ids = cache.get(key)
+        if organization_ids is None:
+            organization_ids = frozenset(
+                self.organization_memberships.filter(
+                    is_active=True
+                ).values_list('organization_id', flat=True)
+            )
+            cache.set(key, organization_ids, self.ORGANIZATION_IDS_CACHE_TTL)
+        return organization_ids
+    
     @property
     def display_name(self):
         """
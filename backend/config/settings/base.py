@@ -43,6 +43,8 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',  # Must wrap ConditionalGet so ETags are computed pre-compression
+    'django.middleware.http.ConditionalGetMiddleware',  # ETag + 304 on If-None-Match
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -107,6 +109,25 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# Argon2 is the primary hasher; the others only verify legacy hashes and
+# get upgraded to Argon2 on the next successful login.
+PASSWORD_HASHERS = [
+    'apps.users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Argon2 cost parameters. Every login and registration pays this cost on a
+# worker, so it directly bounds auth throughput: target ~250ms per hash on
+# production hardware (too fast weakens offline attacks, too slow starves
+# workers). Memory cost is in KiB. Changing these values rehashes each
+# password transparently on its next successful login.
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=3, cast=int)
+ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', default=65536, cast=int)
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=4, cast=int)
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -128,7 +149,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.core.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -40,6 +40,17 @@ def django_db_setup(django_db_setup):
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_plan_cache():
+    """
+    Subscription plans are memoized per process by the organizations
+    signals; reset them so no test sees a plan rolled back by another.
+    """
+    from apps.organizations.signals import _get_plan_by_type
+    _get_plan_by_type.cache_clear()
+    yield
+
+
 @pytest.fixture
 def db_clean():
     """
@@ -0,0 +1,62 @@
+"""
+NexusPM Enterprise - API Renderer Unit Tests
+
+Validates the orjson renderer produces the same JSON as DRF's default
+renderer for the types our API responses contain.
+"""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    """Test ORJSONRenderer output."""
+
+    def test_renders_bytes(self):
+        """Test rendering returns UTF-8 JSON bytes."""
+        rendered = ORJSONRenderer().render({'name': 'Café', 'count': 3})
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered), {'name': 'Café', 'count': 3})
+
+    def test_none_renders_empty_body(self):
+        """Test None data renders an empty body like DRF's JSONRenderer."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_matches_drf_renderer_for_api_types(self):
+        """Test datetimes, UUIDs, Decimals and strings render byte-for-byte like DRF."""
+        data = {
+            'id': uuid.uuid4(),
+            'created_at': timezone.now(),
+            'naive_at': datetime.datetime(2024, 5, 1, 9, 30, 15, 250000),
+            'offset_at': datetime.datetime(
+                2024, 5, 1, 9, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+            ),
+            'due_date': datetime.date(2024, 5, 31),
+            'price': Decimal('19.99'),
+            'name': 'Café \u2028 line',
+            'tags': ['web', 'mobile'],
+            3: 'int key',
+        }
+
+        expected = JSONRenderer().render(data)
+        actual = ORJSONRenderer().render(data)
+
+        self.assertEqual(actual, expected)
+
+        print(f"✅ orjson renderer output matches DRF: {actual[:40]!r}")
+
+    def test_non_finite_floats_render_as_null(self):
+        """Test the documented difference: NaN renders as null where DRF raises."""
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({'ratio': float('nan')})
+
+        self.assertEqual(ORJSONRenderer().render({'ratio': float('nan')}), b'{"ratio":null}')
@@ -11,6 +11,7 @@ from django.db import IntegrityError
 from django.utils import timezone
 from django.utils.text import slugify
 from decimal import Decimal
+from unittest.mock import patch
 
 from apps.organizations.models import Organization, SubscriptionPlan, Subscription, OrganizationMembership
 from tests.factories.user_factories import UserFactory, AdminUserFactory
@@ -77,6 +78,29 @@ class TestOrganizationModel(TestCase):
         
         self.assertNotEqual(org1.slug, org2.slug)
         print(f"✅ Slug uniqueness: {org1.slug} vs {org2.slug}")
+    
+    def test_organization_slug_suffix_single_query(self):
+        """Test colliding slugs get the next suffix from one lookup."""
+        owner = UserFactory()
+        Organization.objects.create(name='Slug Corp', owner=owner)
+        Organization.objects.create(name='Slug Corp', owner=owner, slug='slug-corp-4')
+        Organization.objects.create(name='Slug Corp Labs', owner=owner)
+        
+        org = Organization.objects.create(name='Slug Corp', owner=owner)
+        
+        self.assertEqual(org.slug, 'slug-corp-5')
+        print(f"✅ Slug suffix resolved: {org.slug}")
+    
+    def test_create_rolls_back_failed_bootstrap(self):
+        """Test a failing signup bootstrap leaves no organization behind."""
+        owner = UserFactory()
+        
+        with patch.object(OrganizationMembership.objects, 'create', side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                Organization.objects.create(name='Half Corp', owner=owner)
+        
+        self.assertFalse(Organization.objects.filter(name='Half Corp').exists())
+        print("✅ Failed bootstrap rolled back the organization")
 
 
 class TestOrganizationValidation(TestCase):
@@ -434,6 +458,306 @@ class TestOrganizationIntegration(TestCase):
         print("✅ Organization deletion cascade behavior verified")
 
 
+class TestOrganizationSubscriptionAccess(TestCase):
+    """Test Organization current subscription and plan lookups."""
+    
+    def create_subscription(self, organization, plan, status='active'):
+        """Create a subscription directly with a unique Stripe id."""
+        return Subscription.objects.create(
+            organization=organization,
+            plan=plan,
+            status=status,
+            billing_cycle='monthly',
+            stripe_subscription_id=f"sub_{organization.slug}_{plan.plan_type}",
+            current_period_start=timezone.now(),
+            current_period_end=timezone.now() + timezone.timedelta(days=30)
+        )
+    
+    def test_current_plan_is_cached(self):
+        """Test feature and limit checks share one subscription lookup."""
+        org = OrganizationFactory(name='Cached Plan Org', slug='cached-plan-org')
+        plan = SubscriptionPlanFactory(plan_type='professional')
+        self.create_subscription(org, plan)
+        org = Organization.objects.get(pk=org.pk)
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(org.current_plan, plan)
+            org.is_feature_enabled('analytics')
+            org.get_usage_limits()
+        
+        print(f"✅ Current plan cached: {org.current_plan.name}")
+    
+    def test_subscription_change_invalidates_cache(self):
+        """Test saving a subscription refreshes the organization's cached plan."""
+        org = OrganizationFactory(name='Upgrade Org', slug='upgrade-org')
+        starter = SubscriptionPlanFactory(plan_type='starter')
+        enterprise = SubscriptionPlanFactory(plan_type='enterprise')
+        subscription = self.create_subscription(org, starter)
+        self.assertEqual(org.current_plan, starter)
+        
+        subscription.plan = enterprise
+        subscription.save()
+        
+        self.assertEqual(org.current_plan, enterprise)
+        
+        print(f"✅ Plan cache invalidated: {starter.name} → {enterprise.name}")
+    
+    def test_current_subscription_is_newest(self):
+        """Test the newest live subscription is current, with or without prefetching."""
+        org = OrganizationFactory(name='Renewed Org', slug='renewed-org')
+        starter = SubscriptionPlanFactory(plan_type='starter')
+        professional = SubscriptionPlanFactory(plan_type='professional')
+        self.create_subscription(org, starter)
+        newest = self.create_subscription(org, professional, status='trialing')
+        
+        self.assertEqual(Organization.objects.get(pk=org.pk).current_subscription, newest)
+        self.assertEqual(
+            Organization.objects.with_current_plan().get(pk=org.pk).current_subscription,
+            newest
+        )
+        
+        print(f"✅ Current subscription: {newest.plan.name}")
+    
+    def test_active_subscription_reactivates_organization(self):
+        """Test an active subscription restores a suspended organization's status."""
+        org = OrganizationFactory(
+            name='Suspended Org',
+            slug='suspended-org',
+            status=Organization.Status.SUSPENDED
+        )
+        plan = SubscriptionPlanFactory(plan_type='starter')
+        subscription = self.create_subscription(org, plan)
+        
+        org.refresh_from_db()
+        self.assertEqual(org.status, Organization.Status.ACTIVE)
+        
+        # Redelivered events only write the subscription itself
+        with self.assertNumQueries(1):
+            subscription.save()
+        
+        print(f"✅ Organization reactivated: {org.status}")
+    
+    def test_subscription_signal_loads_relations_once(self):
+        """Test saving a bare subscription loads organization and plan in one query."""
+        org = OrganizationFactory(name='Webhook Org', slug='webhook-org')
+        plan = SubscriptionPlanFactory(plan_type='starter')
+        subscription = self.create_subscription(org, plan)
+        
+        subscription = Subscription.objects.get(pk=subscription.pk)
+        with self.assertNumQueries(2):  # UPDATE + one JOINed reload
+            subscription.save()
+        
+        print(f"✅ Subscription relations loaded once: {subscription}")
+    
+    def test_bulk_sync_from_stripe(self):
+        """Test Stripe reconciliation updates subscriptions in bulk."""
+        plan = SubscriptionPlanFactory(plan_type='starter')
+        org = OrganizationFactory(
+            name='Synced Org',
+            slug='synced-org',
+            status=Organization.Status.SUSPENDED
+        )
+        other_org = OrganizationFactory(name='Past Due Org', slug='past-due-org')
+        subscription = self.create_subscription(org, plan, status='past_due')
+        other_subscription = self.create_subscription(other_org, plan)
+        period_end = timezone.now() + timezone.timedelta(days=60)
+        
+        with self.assertNumQueries(3):
+            updated = Subscription.objects.bulk_sync_from_stripe([
+                (subscription.stripe_subscription_id, 'active', timezone.now(), period_end),
+                (other_subscription.stripe_subscription_id, 'past_due', timezone.now(), period_end),
+                ('sub_unknown', 'active', timezone.now(), period_end),
+            ])
+        
+        self.assertEqual(len(updated), 2)
+        subscription.refresh_from_db()
+        other_subscription.refresh_from_db()
+        org.refresh_from_db()
+        self.assertEqual(subscription.status, 'active')
+        self.assertEqual(other_subscription.status, 'past_due')
+        self.assertEqual(org.status, Organization.Status.ACTIVE)
+        
+        print(f"✅ Stripe sync: {len(updated)} subscriptions updated")
+    
+    def test_bulk_provision(self):
+        """Test bulk provisioning sets up subscriptions and owners like single creation."""
+        free_plan = SubscriptionPlanFactory(plan_type='free')
+        owners = UserFactory.create_batch(3)
+        
+        # Owners, orgs, plan, subscriptions, memberships + the savepoint pair
+        with self.assertNumQueries(7):
+            orgs = Organization.objects.bulk_provision([
+                Organization(name=f'Imported Org {i}', owner_id=owner.id)
+                for i, owner in enumerate(owners)
+            ])
+        
+        self.assertEqual(len(orgs), 3)
+        for org, owner in zip(orgs, owners):
+            org = Organization.objects.get(pk=org.pk)
+            self.assertEqual(org.slug, slugify(org.name))
+            self.assertEqual(org.current_plan, free_plan)
+            self.assertEqual(org.active_members_count, 1)
+            self.assertIn('preferences', org.settings)
+            self.assertTrue(org.memberships.filter(
+                user=owner, role=OrganizationMembership.Role.OWNER
+            ).exists())
+        
+        print(f"✅ Bulk provisioned {len(orgs)} organizations")
+    
+    def test_bulk_provision_is_atomic(self):
+        """Test a slug collision part way through provisions nothing."""
+        SubscriptionPlanFactory(plan_type='free')
+        owner = UserFactory()
+        OrganizationFactory(name='Taken', slug='imported-org-1')
+        
+        with self.assertRaises(IntegrityError):
+            Organization.objects.bulk_provision([
+                Organization(name=f'Imported Org {i}', owner=owner) for i in range(3)
+            ])
+        
+        self.assertFalse(Organization.objects.filter(name__startswith='Imported Org').exists())
+        self.assertFalse(OrganizationMembership.objects.filter(organization__name__startswith='Imported').exists())
+        print("✅ Failed bulk provision rolled back")
+    
+    def test_with_current_plan_prefetch(self):
+        """Test listing organizations with plans uses a fixed number of queries."""
+        plan = SubscriptionPlanFactory(plan_type='starter')
+        for i in range(3):
+            org = OrganizationFactory(name=f'Listed Org {i}', slug=f'listed-org-{i}')
+            self.create_subscription(org, plan)
+        OrganizationFactory(name='No Plan Org', slug='no-plan-org')
+        
+        with self.assertNumQueries(2):
+            plans = {
+                org.slug: org.current_plan
+                for org in Organization.objects.with_current_plan()
+            }
+        
+        self.assertEqual(plans['listed-org-0'], plan)
+        self.assertIsNone(plans['no-plan-org'])
+        
+        print(f"✅ Current plans prefetched for {len(plans)} organizations")
+    
+    def test_plan_lookup_is_memoized(self):
+        """Test plan lookups for new organizations are cached until a plan changes."""
+        from apps.organizations.signals import _get_plan_by_type
+        
+        plan = SubscriptionPlanFactory(plan_type='free')
+        self.assertEqual(_get_plan_by_type('free'), plan)
+        with self.assertNumQueries(0):
+            self.assertEqual(_get_plan_by_type('free'), plan)
+        
+        plan.max_users = 10
+        plan.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(_get_plan_by_type('free').max_users, 10)
+        
+        print(f"✅ Plan lookup memoized: {plan.name}")
+    
+    def test_check_usage_limit_users(self):
+        """Test the user limit check against the plan's max_users."""
+        org = OrganizationFactory(name='Limited Org', slug='limited-org')
+        plan = SubscriptionPlanFactory(plan_type='starter', max_users=3)
+        self.create_subscription(org, plan)
+        
+        # The owner is the first member
+        OrganizationMembershipFactory(organization=org)
+        self.assertTrue(org.check_usage_limit('users'))
+        
+        OrganizationMembershipFactory(organization=org)
+        self.assertFalse(org.check_usage_limit('users'))
+        
+        print(f"✅ User limit enforced at {plan.max_users} members")
+    
+    def test_cached_usage_limits_invalidation(self):
+        """Test cached usage limits refresh after subscription and plan changes."""
+        org = OrganizationFactory(name='Limits Cache Org', slug='limits-cache-org')
+        starter = SubscriptionPlanFactory(plan_type='starter', max_projects_per_workspace=5)
+        enterprise = SubscriptionPlanFactory(plan_type='enterprise', max_projects_per_workspace=50)
+        subscription = self.create_subscription(org, starter)
+        
+        self.assertEqual(org.get_cached_usage_limits()['max_projects_per_workspace'], 5)
+        with self.assertNumQueries(0):
+            org.get_cached_usage_limits()
+        
+        subscription.plan = enterprise
+        subscription.save()
+        self.assertEqual(org.get_cached_usage_limits()['max_projects_per_workspace'], 50)
+        
+        enterprise.max_projects_per_workspace = 100
+        enterprise.save()
+        org = Organization.objects.get(pk=org.pk)
+        self.assertEqual(org.get_cached_usage_limits()['max_projects_per_workspace'], 100)
+        
+        Subscription.objects.get(pk=subscription.pk).delete()
+        org = Organization.objects.get(pk=org.pk)
+        self.assertNotEqual(org.get_cached_usage_limits()['max_projects_per_workspace'], 100)
+        
+        print("✅ Cached usage limits invalidated on subscription and plan changes")
+    
+    def test_active_members_count_tracks_memberships(self):
+        """Test the denormalized member counter follows joins, deactivations and removals."""
+        org = OrganizationFactory(name='Counted Org', slug='counted-org')
+        self.assertEqual(org.active_members_count, 1)  # Owner
+        
+        membership = OrganizationMembershipFactory(organization=org)
+        OrganizationMembershipFactory(organization=org, is_active=False)
+        self.assertEqual(org.active_members_count, 2)
+        
+        membership.is_active = False
+        membership.save(update_fields=['is_active'])
+        self.assertEqual(org.active_members_count, 1)
+        
+        membership.role = OrganizationMembership.Role.ADMIN
+        with self.assertNumQueries(1):  # Role-only change: no counter work
+            membership.save(update_fields=['role'])
+        
+        membership.is_active = True
+        membership.save()
+        self.assertEqual(org.active_members_count, 2)
+        membership.delete()
+        org.refresh_from_db()
+        self.assertEqual(org.active_members_count, 1)
+        
+        Organization.objects.filter(pk=org.pk).update(active_members_count=0)
+        OrganizationMembership.objects.get(organization=org, user=org.owner).delete()
+        org.refresh_from_db()
+        self.assertEqual(org.active_members_count, 0)  # Drifted counter clamps at 0
+        
+        print(f"✅ Active member counter: {org.active_members_count}")
+    
+    def test_fixture_loads_skip_member_counter(self):
+        """Test raw (loaddata) membership saves leave the stored counter alone."""
+        org = OrganizationFactory(name='Fixture Org', slug='fixture-org')
+        now = timezone.now()
+        membership = OrganizationMembership(
+            organization=org,
+            user=UserFactory(),
+            joined_at=now,
+            last_active_at=now,
+        )
+        membership.save_base(raw=True)
+        
+        org.refresh_from_db()
+        self.assertEqual(org.active_members_count, 1)  # Owner only
+        
+        print("✅ Fixture loads skip the member counter")
+    
+    def test_lite_querysets_defer_json(self):
+        """Test lite()/pricing_only() leave the JSON columns unloaded."""
+        OrganizationFactory(name='Lite Org', slug='lite-org')
+        SubscriptionPlanFactory(plan_type='starter')
+        
+        org = Organization.objects.lite().get(slug='lite-org')
+        plan = SubscriptionPlan.objects.pricing_only().get(plan_type='starter')
+        
+        self.assertIn('settings', org.get_deferred_fields())
+        self.assertIn('features', plan.get_deferred_fields())
+        self.assertEqual(org.name, 'Lite Org')
+        
+        print(f"✅ Lite querysets: {org.slug}, {plan.name}")
+
+
 class TestOrganizationPerformance(TestCase):
     """Test Organization model performance and edge cases."""
     
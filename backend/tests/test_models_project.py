@@ -0,0 +1,388 @@
+"""
+NexusPM Enterprise - Project & Task Model Unit Tests
+
+Covers project progress tracking and task helpers.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core import slugs
+from apps.projects.models import Project, Task, TaskDependency, ProjectMembership
+from tests.factories.organization_factories import OrganizationFactory
+from tests.factories.user_factories import UserFactory
+from tests.factories.workspace_factories import WorkspaceFactory
+
+
+class ProjectTestMixin:
+    """Shared project/task builders for project model tests."""
+    
+    def setUp(self):
+        self.organization = OrganizationFactory(name='Projects Org', slug='projects-org')
+        self.owner = self.organization.owner
+        self.workspace = WorkspaceFactory(
+            organization=self.organization, name='Delivery', slug='delivery'
+        )
+    
+    def create_project(self, name='Mobile App V3', **kwargs):
+        return Project.objects.create(
+            name=name, workspace=self.workspace, created_by=self.owner, **kwargs
+        )
+    
+    def create_tasks(self, project, statuses):
+        return [
+            Task.objects.create(
+                title=f"Task {i}", project=project, created_by=self.owner, status=status
+            )
+            for i, status in enumerate(statuses)
+        ]
+
+
+class TestProjectSlug(ProjectTestMixin, TestCase):
+    """Test project slug generation."""
+    
+    def test_slug_unique_within_workspace(self):
+        """Test colliding names get the next numeric suffix within a workspace."""
+        slugs = [self.create_project(name='Launch').slug for _ in range(3)]
+        other_workspace = WorkspaceFactory(
+            organization=self.organization, name='Growth', slug='growth'
+        )
+        other = Project.objects.create(
+            name='Launch', workspace=other_workspace, created_by=self.owner
+        )
+        
+        self.assertEqual(slugs, ['launch', 'launch-1', 'launch-2'])
+        self.assertEqual(other.slug, 'launch')
+        
+        print(f"✅ Project slugs deduplicated: {slugs}")
+    
+    def test_slug_falls_back_for_unsluggable_names(self):
+        """Test names without slug-safe characters still get a real slug."""
+        projects = [self.create_project(name='???') for _ in range(2)]
+        
+        self.assertEqual([project.slug for project in projects], ['project', 'project-1'])
+        
+        print("✅ Unsluggable project names fall back to 'project'")
+    
+    def test_slug_collision_race_retries(self):
+        """Test a slug taken between lookup and insert is retried with a new suffix."""
+        self.create_project(name='Launch')
+        # The first lookup misses the row a concurrent save just committed
+        with patch.object(slugs, 'unique_slug', side_effect=['launch', 'launch-1']) as lookup:
+            project = self.create_project(name='Launch')
+        
+        self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(project.slug, 'launch-1')
+        self.assertEqual(Project.objects.filter(workspace=self.workspace).count(), 2)
+        
+        print(f"✅ Slug race retried: {project.slug}")
+
+
+class TestProjectProgress(ProjectTestMixin, TestCase):
+    """Test project progress calculation."""
+    
+    def test_calculate_progress_percentage(self):
+        """Test progress counts completed and verified tasks, ignoring deleted ones."""
+        project = self.create_project()
+        tasks = self.create_tasks(project, [
+            Task.Status.COMPLETED, Task.Status.VERIFIED, Task.Status.TODO, Task.Status.COMPLETED
+        ])
+        tasks[3].soft_delete()
+        Project.objects.filter(id=project.id).update(progress_percentage=0)
+        project.progress_percentage = 0
+        
+        with self.assertNumQueries(2):  # Re-read the counters + the changed-value save
+            progress = project.calculate_progress_percentage()
+        
+        self.assertEqual(progress, 67)
+        project.refresh_from_db()
+        self.assertEqual(project.progress_percentage, 67)
+        
+        print(f"✅ Project progress calculated: {progress}%")
+    
+    def test_calculate_progress_without_tasks(self):
+        """Test a project without tasks reports 0% progress."""
+        project = self.create_project()
+        
+        self.assertEqual(project.calculate_progress_percentage(), 0)
+        
+        print("✅ Empty project progress is 0%")
+    
+    def test_recompute_progress_bulk(self):
+        """Test progress is recomputed for many projects with a fixed number of queries."""
+        half_done = self.create_project(name='Half Done')
+        self.create_tasks(half_done, [Task.Status.COMPLETED, Task.Status.IN_PROGRESS])
+        all_done = self.create_project(name='All Done')
+        self.create_tasks(all_done, [Task.Status.VERIFIED])
+        empty = self.create_project(name='Empty')
+        Project.objects.filter(id__in=[half_done.id, all_done.id, empty.id]).update(
+            progress_percentage=0
+        )
+        
+        ids = [half_done.id, all_done.id, empty.id]
+        with self.assertNumQueries(3):  # Counts, projects, bulk_update
+            updated = Project.objects.recompute_progress(ids)
+        
+        self.assertEqual(updated, 2)
+        progress = dict(Project.objects.filter(id__in=ids).values_list('name', 'progress_percentage'))
+        self.assertEqual(progress, {'Half Done': 50, 'All Done': 100, 'Empty': 0})
+        
+        print(f"✅ Bulk progress recomputed: {progress}")
+    
+    def test_task_counters_follow_task_changes(self):
+        """Test the denormalized task counters track creates, status changes and deletes."""
+        project = self.create_project()
+        tasks = self.create_tasks(project, [
+            Task.Status.TODO, Task.Status.IN_PROGRESS, Task.Status.BLOCKED, Task.Status.COMPLETED
+        ])
+        
+        def counters():
+            return Project.objects.values_list(
+                'task_total', 'task_completed', 'task_in_progress', 'task_blocked'
+            ).get(id=project.id)
+        
+        self.assertEqual(counters(), (4, 1, 1, 1))
+        project.refresh_from_db()
+        self.assertEqual(
+            project.get_task_counter_summary(),
+            {'completed': 1, 'in_progress': 1, 'blocked': 1, 'other': 1}
+        )
+        self.assertEqual(
+            {row['status']: row['count'] for row in project.get_task_counts_by_status()},
+            {'todo': 1, 'in_progress': 1, 'blocked': 1, 'completed': 1}
+        )
+        
+        tasks[1].status = Task.Status.VERIFIED
+        tasks[1].save()
+        self.assertEqual(counters(), (4, 2, 0, 1))
+        
+        tasks[2].soft_delete()
+        tasks[0].delete()
+        self.assertEqual(counters(), (2, 2, 0, 0))
+        
+        project.soft_delete()
+        self.assertEqual(counters(), (0, 0, 0, 0))
+        
+        print(f"✅ Task counters in sync: {counters()}")
+    
+    def test_task_counters_skip_unrelated_saves(self):
+        """Test saves that leave status and deleted_at alone do not touch the project."""
+        project = self.create_project()
+        task, = self.create_tasks(project, [Task.Status.TODO])
+        
+        task.title = 'Renamed'
+        with self.assertNumQueries(1):  # The task UPDATE only
+            task.save(update_fields=['title'])
+        with self.assertNumQueries(2):  # Stored status lookup + the task UPDATE
+            task.save()
+        
+        task.status = Task.Status.COMPLETED
+        task.save()
+        self.assertEqual((project.task_total, project.task_completed), (1, 1))
+        self.assertEqual(project.progress_percentage, 100)
+        project.refresh_from_db()
+        self.assertEqual((project.task_total, project.task_completed), (1, 1))
+        
+        print("✅ Unrelated task saves skip the counters")
+    
+    def test_fixture_loads_skip_task_counters(self):
+        """Test raw (loaddata) task saves do not add to the fixture's counters."""
+        project = self.create_project()
+        task = Task(
+            title='Fixture Task', project=project, created_by=self.owner,
+            status=Task.Status.COMPLETED, created_at=timezone.now(), updated_at=timezone.now()
+        )
+        
+        task.save_base(raw=True)
+        
+        project.refresh_from_db()
+        self.assertEqual((project.task_total, project.task_completed), (0, 0))
+        
+        print("✅ Raw task saves leave the counters alone")
+    
+    def test_progress_follows_counters_with_separate_project_copies(self):
+        """Test progress is computed in the database, not from stale loaded projects."""
+        project = self.create_project()
+        self.create_tasks(project, [Task.Status.TODO, Task.Status.TODO])
+        
+        for task in list(Task.objects.select_related('project').filter(project=project)):
+            task.status = Task.Status.COMPLETED
+            task.save()
+        
+        project.refresh_from_db()
+        self.assertEqual((project.task_total, project.task_completed), (2, 2))
+        self.assertEqual(project.progress_percentage, 100)
+        
+        print(f"✅ Progress in step with counters: {project.progress_percentage}%")
+    
+    def test_task_counters_follow_project_moves(self):
+        """Test moving a task to another project moves its counts and progress."""
+        source = self.create_project(name='Source')
+        target = self.create_project(name='Target')
+        done, todo = self.create_tasks(source, [Task.Status.COMPLETED, Task.Status.TODO])
+        
+        done.project = target
+        done.save()
+        
+        counts = {
+            project.name: (project.task_total, project.task_completed, project.progress_percentage)
+            for project in Project.objects.filter(id__in=[source.id, target.id])
+        }
+        self.assertEqual(counts, {'Source': (1, 0, 0), 'Target': (1, 1, 100)})
+        
+        print(f"✅ Counters moved with the task: {counts}")
+    
+    def test_soft_delete_bulk(self):
+        """Test soft_delete_bulk archives projects and their tasks with set-based updates."""
+        archived = [self.create_project(name=f'Legacy {i}') for i in range(3)]
+        kept = self.create_project(name='Current')
+        for project in archived + [kept]:
+            self.create_tasks(project, [Task.Status.TODO, Task.Status.COMPLETED])
+        
+        with self.assertNumQueries(5):  # Ids, projects, tasks + the savepoint pair
+            updated = Project.objects.soft_delete_bulk(
+                Project.objects.filter(name__startswith='Legacy')
+            )
+        
+        self.assertEqual(updated, 3)
+        self.assertEqual(
+            set(Project.objects.filter(deleted_at__isnull=True).values_list('name', flat=True)),
+            {'Current'}
+        )
+        self.assertFalse(
+            Project.objects.filter(name__startswith='Legacy').exclude(status=Project.Status.ARCHIVED).exists()
+        )
+        self.assertEqual(Task.objects.filter(deleted_at__isnull=True).count(), 2)
+        self.assertEqual(
+            Project.objects.filter(name__startswith='Legacy', task_total=0).count(), 3
+        )
+        
+        print(f"✅ Bulk soft deleted {updated} projects")
+
+
+class TestOverdue(ProjectTestMixin, TestCase):
+    """Test overdue checks in Python and SQL."""
+    
+    def test_with_overdue_matches_property(self):
+        """Test with_overdue() annotations agree with the is_overdue properties."""
+        yesterday = timezone.now() - timedelta(days=1)
+        late = self.create_project(name='Late', due_date=yesterday.date())
+        self.create_project(name='Done', due_date=yesterday.date(), status=Project.Status.COMPLETED)
+        self.create_project(name='Open')
+        late_task, done_task = self.create_tasks(late, [Task.Status.TODO, Task.Status.VERIFIED])
+        Task.objects.filter(id__in=[late_task.id, done_task.id]).update(due_date=yesterday)
+        
+        overdue_projects = set(
+            Project.objects.with_overdue().filter(is_overdue_db=True).values_list('name', flat=True)
+        )
+        self.assertEqual(overdue_projects, {'Late'})
+        for project in Project.objects.all():
+            self.assertEqual(project.is_overdue, project.name in overdue_projects)
+        
+        with self.assertNumQueries(1):
+            overdue_tasks = [task.id for task in Task.objects.with_overdue() if task.is_overdue]
+        self.assertEqual(overdue_tasks, [late_task.id])
+        
+        print(f"✅ Overdue projects: {overdue_projects}")
+
+
+class TestTaskDependencies(ProjectTestMixin, TestCase):
+    """Test task blocking checks."""
+    
+    def test_is_blocked_by_incomplete_dependency(self):
+        """Test a task is blocked until its dependencies are done."""
+        project = self.create_project()
+        blocker, blocked = self.create_tasks(project, [Task.Status.IN_PROGRESS, Task.Status.TODO])
+        TaskDependency.objects.create(from_task=blocked, to_task=blocker)
+        
+        self.assertTrue(blocked.is_blocked)
+        self.assertEqual(blocked.get_blocking_tasks(), [blocker])
+        
+        Task.objects.filter(id=blocker.id).update(status=Task.Status.COMPLETED)
+        self.assertFalse(blocked.is_blocked)
+        
+        print("✅ Task blocked until dependency completes")
+    
+    def test_with_blocking_prefetches_dependencies(self):
+        """Test with_blocking() answers is_blocked for a task list without per-task queries."""
+        project = self.create_project()
+        blocker, blocked, free = self.create_tasks(project, [
+            Task.Status.IN_PROGRESS, Task.Status.TODO, Task.Status.TODO
+        ])
+        TaskDependency.objects.create(from_task=blocked, to_task=blocker)
+        
+        with self.assertNumQueries(2):  # Tasks + prefetched dependencies
+            blocked_titles = {
+                task.title for task in Task.objects.with_blocking().filter(project=project)
+                if task.is_blocked
+            }
+        
+        self.assertEqual(blocked_titles, {blocked.title})
+        prefetched = Task.objects.with_blocking().get(id=blocked.id)
+        self.assertEqual(prefetched.get_blocking_tasks(), blocked.get_blocking_tasks())
+        
+        print(f"✅ Prefetched blocking check: {blocked_titles}")
+    
+    def test_clean_rejects_circular_dependency(self):
+        """Test clean() rejects a dependency that closes a cycle, in one query."""
+        project = self.create_project()
+        first, second, third = self.create_tasks(project, [
+            Task.Status.TODO, Task.Status.TODO, Task.Status.TODO
+        ])
+        TaskDependency.objects.create(from_task=first, to_task=second)
+        TaskDependency.objects.create(from_task=second, to_task=third)
+        
+        closing = TaskDependency(from_task=third, to_task=first)
+        with self.assertNumQueries(1):
+            self.assertTrue(closing.creates_cycle())
+        with self.assertRaises(ValidationError):
+            closing.clean()
+        
+        TaskDependency(from_task=first, to_task=third).clean()
+        
+        print("✅ Circular dependency rejected")
+
+
+class TestProjectQuerysets(ProjectTestMixin, TestCase):
+    """Test list/board querysets."""
+    
+    def test_list_querysets_defer_wide_columns(self):
+        """Test for_list()/for_board() leave text and JSON columns unloaded."""
+        project = self.create_project(description='Long project brief')
+        self.create_tasks(project, [Task.Status.TODO])
+        
+        listed = Project.objects.for_list().get(pk=project.pk)
+        task = Task.objects.for_board().get(project=project)
+        
+        self.assertTrue({'description', 'tags', 'settings'} <= listed.get_deferred_fields())
+        self.assertTrue({'description', 'acceptance_criteria', 'tags'} <= task.get_deferred_fields())
+        self.assertEqual(listed.name, project.name)
+        
+        print(f"✅ List querysets: {listed.slug}, {task.title}")
+    
+    def test_with_active_members_prefetch(self):
+        """Test with_active_members() loads members and roles for all projects in 2 queries."""
+        for name in ('Alpha', 'Beta'):
+            project = self.create_project(name=name)
+            ProjectMembership.objects.create(
+                user=UserFactory(), project=project, role=ProjectMembership.Role.REVIEWER
+            )
+            ProjectMembership.objects.create(user=UserFactory(), project=project, is_active=False)
+        
+        with self.assertNumQueries(2):  # Projects + memberships joined to users
+            teams = {
+                project.name: sorted(
+                    (membership.role, membership.user.email == self.owner.email)
+                    for membership in project.active_memberships
+                )
+                for project in Project.objects.with_active_members().filter(workspace=self.workspace)
+            }
+        
+        expected = [('lead', True), ('reviewer', False)]
+        self.assertEqual(teams, {'Alpha': expected, 'Beta': expected})
+        
+        print(f"✅ Active members prefetched: {teams}")
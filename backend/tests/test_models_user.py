@@ -371,6 +371,95 @@ class TestUserQuerysets(TestCase):
         
         print(f"✅ Staff user filtering: {staff_count} staff, {regular_count} regular")
 
+    def test_with_organizations_count_queryset(self):
+        """Test organization count annotation only counts active memberships."""
+        from tests.factories.organization_factories import (
+            OrganizationFactory,
+            OrganizationMembershipFactory
+        )
+
+        user = UserFactory()
+        # Owner membership created by signal
+        OrganizationFactory(owner=user, name='Count Owned', slug='count-owned')
+        OrganizationMembershipFactory(
+            user=user,
+            organization=OrganizationFactory(name='Count Active', slug='count-active'),
+            is_active=True
+        )
+        OrganizationMembershipFactory(
+            user=user,
+            organization=OrganizationFactory(name='Count Inactive', slug='count-inactive'),
+            is_active=False
+        )
+
+        with self.assertNumQueries(1):
+            annotated = User.objects.with_organizations_count().get(pk=user.pk)
+            self.assertEqual(annotated.organizations_count, 2)
+
+        print(f"✅ Organizations count annotation: {annotated.organizations_count}")
+
+    def test_with_active_memberships_queryset(self):
+        """Test active memberships are prefetched without per-user queries."""
+        from tests.factories.organization_factories import OrganizationFactory
+
+        users = UserFactory.create_batch(3)
+        for index, user in enumerate(users):
+            OrganizationFactory(owner=user, name=f'Prefetch Org {index}', slug=f'prefetch-org-{index}')
+
+        with self.assertNumQueries(2):
+            for user in User.objects.with_active_memberships():
+                self.assertEqual(len(user.active_memberships), 1)
+                self.assertTrue(user.active_memberships[0].organization.name)
+
+        print(f"✅ Active memberships prefetched for {len(users)} users")
+
+    def test_by_organization_queryset(self):
+        """Test organization filtering returns each active member once."""
+        from tests.factories.organization_factories import (
+            OrganizationFactory,
+            OrganizationMembershipFactory
+        )
+
+        owner = UserFactory()
+        org = OrganizationFactory(owner=owner, name='Member Org', slug='member-org')
+        other_org = OrganizationFactory(name='Other Org', slug='other-org')
+        member = UserFactory()
+        former_member = UserFactory()
+        OrganizationMembershipFactory(user=member, organization=org, invited_by=owner)
+        OrganizationMembershipFactory(user=member, organization=other_org, invited_by=owner)
+        OrganizationMembershipFactory(
+            user=former_member, organization=org, invited_by=owner, is_active=False
+        )
+
+        org_users = list(User.objects.by_organization(org.id))
+        self.assertCountEqual(org_users, [owner, member])
+
+        shared_users = list(User.objects.sharing_organizations_with(member))
+        self.assertCountEqual(shared_users, [owner, member, other_org.owner])
+
+        print(f"✅ Organization filtering: {len(org_users)} members")
+
+    def test_organization_ids_cache(self):
+        """Test organization ids are cached and invalidated on membership changes."""
+        from tests.factories.organization_factories import (
+            OrganizationFactory,
+            OrganizationMembershipFactory
+        )
+
+        user = UserFactory()
+        org = OrganizationFactory(name='Cached Org', slug='cached-org')
+        membership = OrganizationMembershipFactory(user=user, organization=org)
+
+        self.assertEqual(user.get_organization_ids(), {org.id})
+        with self.assertNumQueries(0):
+            user.get_organization_ids()
+
+        membership.is_active = False
+        membership.save()
+        self.assertEqual(user.get_organization_ids(), frozenset())
+
+        print(f"✅ Organization ids cached for {user.email}")
+
 
 class TestUserEdgeCases(TestCase):
     """Test User model edge cases and error handling."""